@@ -5,9 +5,13 @@ Orchestrates LLM testing against OpenSCAD coding challenges.
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import queue
+import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,15 +19,29 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.config import get_config, load_config, ConfigError
-from src.openrouter import send_prompt, extract_code, OpenRouterError
-from src.parallel import run_models_parallel, ModelStatus
-from challenges import discover_challenges, filter_challenges, get_model_output_dir, prepare_user_prompt, ChallengeError
-from src.renderer import process_attempt, process_renders_parallel, save_params_json
-from src.animator import animate_stl, AnimationResult
+from src.config import Config, get_config, load_config, ConfigError
+from src.openrouter import send_prompt, extract_code, close_session, OpenRouterError
+from src.parallel import run_models_parallel, shutdown_model_pool, ModelStatus
+from challenges import (
+    discover_challenges, filter_challenges, model_output_path, prepare_model_output_dir,
+    prepare_user_prompt, sweep_scratch_dir, ChallengeError,
+)
+from src.renderer import (
+    process_attempt, process_renders_parallel, save_params_json, default_render_workers,
+    dump_json,
+)
+from src.animator import animate_stl, shutdown_animator, AnimationResult
 
 
-@dataclass
+# Content-addressed STL cache, relative to the project root
+RENDER_CACHE_DIR = ".render_cache"
+
+# Previous attempts are moved here to be deleted in the background, outside
+# the committed results tree; relative to the project root
+SCRATCH_DIR = ".scratch"
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of a single benchmark attempt."""
     challenge: str
@@ -34,6 +52,31 @@ class BenchmarkResult:
     render_time: float | None = None
 
 
+@dataclass(slots=True)
+class AttemptPaths:
+    """Precomputed file locations for a single (challenge, model) attempt.
+    
+    The bookkeeping paths are kept as plain strings so they can be handed
+    straight to open() without re-deriving them for every write.
+    """
+    output_dir: Path
+    response_json: str
+    error_log: str
+    render_error_log: str
+    params_json: str
+    
+    @classmethod
+    def from_output_dir(cls, output_dir: Path) -> "AttemptPaths":
+        """Build the attempt paths for an output directory."""
+        return cls(
+            output_dir=output_dir,
+            response_json=str(output_dir / "response.json"),
+            error_log=str(output_dir / "error.log"),
+            render_error_log=str(output_dir / "render_error.log"),
+            params_json=str(output_dir / "params.json"),
+        )
+
+
 def setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity level."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -48,6 +91,12 @@ def setup_logging(verbose: bool) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
+    # Drop handlers left by a previous call so repeated runs in one process
+    # (tests, notebooks) don't emit and format every record more than once
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
@@ -55,72 +104,144 @@ def setup_logging(verbose: bool) -> None:
     root_logger.addHandler(console_handler)
 
 
-def save_raw_response(output_dir: Path, response: dict) -> None:
+def write_text_file(path: str, text: str) -> None:
+    """Write a small text file in a single call."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def save_raw_response(paths: AttemptPaths, response: dict) -> None:
     """Save raw API response for debugging."""
-    response_file = output_dir / "response.json"
-    with open(response_file, 'w', encoding='utf-8') as f:
-        json.dump(response, f, indent=2)
+    # Serialize in one go and write once rather than streaming encoder chunks;
+    # same serializer as params.json so the artifacts are formatted alike
+    with open(paths.response_json, 'wb') as f:
+        f.write(dump_json(response))
+
+
+def attempt_cache_key(user_prompt: str | list, model: str, config: Config) -> str:
+    """Hash everything that determines the API request for an attempt.
+    
+    The key is stored in params.json so a resumed run can tell whether an
+    existing result was produced by the same prompt, model and parameters.
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "system_prompt": config.system_prompt,
+            "user_prompt": user_prompt,
+            "params": dict(config.api.get_all_params()),
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def is_attempt_complete(paths: AttemptPaths, cache_key: str) -> bool:
+    """Check whether a previous run already rendered this exact attempt."""
+    if not (paths.output_dir / "attempt.stl").exists():
+        return False
+    try:
+        with open(paths.params_json, 'r', encoding='utf-8') as f:
+            params = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(params, dict) and params.get("cache_key") == cache_key
+
+
+def drain_writes(pending: list[Future]) -> None:
+    """Wait for queued file writes to finish, logging any that failed."""
+    logger = logging.getLogger(__name__)
+    for future in pending:
+        try:
+            future.result()
+        except OSError as e:
+            logger.error("Failed to write benchmark file: %s", e)
+    pending.clear()
 
 
 def print_summary(results: list[BenchmarkResult]) -> None:
-    """Print a summary report of benchmark results."""
-    print("\n" + "=" * 60)
-    print("=== Benchmark Complete ===")
-    print("=" * 60)
-    print()
+    """Print a summary report of benchmark results.
+    
+    The report is assembled in memory and written with a single call. When
+    stdout is redirected (not a TTY) the status glyphs are replaced with
+    ASCII so log files stay plain text.
+    """
+    lines = [
+        "",
+        "=" * 60,
+        "=== Benchmark Complete ===",
+        "=" * 60,
+        "",
+    ]
     
     if not results:
-        print("No results to display.")
+        lines.append("No results to display.")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         return
     
-    # Calculate column widths
-    challenge_width = max(len(r.challenge) for r in results)
-    challenge_width = max(challenge_width, len("Challenge"))
+    if sys.stdout.isatty():
+        ok_status, fail_status, api_fail_status = "✓", "✗", "API ✗"
+    else:
+        ok_status, fail_status, api_fail_status = "OK", "FAIL", "API_FAIL"
     
-    model_width = max(len(r.model) for r in results)
-    model_width = max(model_width, len("Model"))
+    # Calculate column widths in a single pass
+    challenge_width = len("Challenge")
+    model_width = len("Model")
+    for r in results:
+        challenge_width = max(challenge_width, len(r.challenge))
+        model_width = max(model_width, len(r.model))
     
     # Truncate model names if too long
     max_model_width = 35
-    if model_width > max_model_width:
-        model_width = max_model_width
+    model_width = min(model_width, max_model_width)
     
-    # Print header
-    print("Results:")
-    header = f"| {'Challenge':<{challenge_width}} | {'Model':<{model_width}} | Render |"
-    separator = f"|{'-' * (challenge_width + 2)}|{'-' * (model_width + 2)}|--------|"
+    # Wide enough for the header and the longest status
+    status_width = max(len("Render"), len(ok_status), len(fail_status), len(api_fail_status))
     
-    print(separator)
-    print(header)
-    print(separator)
+    # Compile the row template once instead of re-parsing dynamic widths per row
+    row_template = "| {:<%d} | {:<%d} | {:^%d} |" % (challenge_width, model_width, status_width)
+    truncated_width = model_width - 3
     
-    # Print results
+    # Header
+    header = f"| {'Challenge':<{challenge_width}} | {'Model':<{model_width}} | {'Render':^{status_width}} |"
+    separator = f"|{'-' * (challenge_width + 2)}|{'-' * (model_width + 2)}|{'-' * (status_width + 2)}|"
+    
+    lines += ["Results:", separator, header, separator]
+    
+    # Results
     successful = 0
     for r in results:
-        model_display = r.model
-        if len(model_display) > model_width:
-            model_display = model_display[:model_width - 3] + "..."
+        model = r.model
+        model_display = model if len(model) <= model_width else model[:truncated_width] + "..."
         
         if r.render_success:
-            status = "✓"
+            status = ok_status
             successful += 1
         elif r.api_success:
-            status = "✗"
+            status = fail_status
         else:
-            status = "API ✗"
+            status = api_fail_status
         
-        print(f"| {r.challenge:<{challenge_width}} | {model_display:<{model_width}} | {status:^6} |")
+        lines.append(row_template.format(r.challenge, model_display, status))
+    
+    lines += [
+        separator,
+        "",
+        f"Total: {successful}/{len(results)} successful renders",
+        "",
+    ]
     
-    print(separator)
-    print()
-    print(f"Total: {successful}/{len(results)} successful renders")
-    print()
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def run_benchmark(
     config_path: str,
     dry_run: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    resume: bool = False,
+    no_cache: bool = False
 ) -> list[BenchmarkResult]:
     """Run the full benchmark suite.
     
@@ -128,12 +249,23 @@ def run_benchmark(
         config_path: Path to the configuration YAML file.
         dry_run: If True, show what would run without calling APIs.
         verbose: If True, enable verbose logging.
+        resume: If True, skip attempts that a previous run already rendered
+            with the same prompt, model and parameters.
+        no_cache: If True, always run OpenSCAD instead of reusing cached
+            renders of identical code, and turn off api.cache_responses.
         
     Returns:
         List of BenchmarkResult objects.
     """
     logger = logging.getLogger(__name__)
-    results: list[BenchmarkResult] = []
+    
+    # One timestamp identifies the whole batch in error logs, rather than
+    # formatting a fresh microsecond-precision datetime on every failure
+    batch_ts = datetime.now().isoformat(timespec='seconds')
+    
+    # Every result for the run, keyed by (challenge, model) so the render
+    # stage can update entries in place
+    all_results: dict[tuple[str, str], BenchmarkResult] = {}
     
     # Load configuration
     logger.info("Loading configuration from %s", config_path)
@@ -154,6 +286,25 @@ def run_benchmark(
     
     logger.info("Loaded %d models from config", len(config.models))
     
+    if no_cache:
+        config.api.cache_responses = False
+    
+    # Bind the config sections used inside the per-attempt loops once
+    api_cfg = config.api
+    anim_cfg = config.animation
+    openscad = config.openscad_path
+    
+    try:
+        render_workers = default_render_workers()
+    except ValueError as e:
+        logger.error("Configuration error: %s", e)
+        sys.exit(1)
+    
+    # STLs are cached by code so identical attempts across runs skip OpenSCAD
+    render_cache_dir = None if no_cache else config.project_root / RENDER_CACHE_DIR
+    
+    scratch_dir = config.project_root / SCRATCH_DIR
+    
     # Discover challenges
     try:
         all_challenges = discover_challenges(config.project_root)
@@ -170,7 +321,7 @@ def run_benchmark(
     
     if not challenges:
         logger.warning("No challenges found to run")
-        return results
+        return list(all_results.values())
     
     # Display discovered challenges
     for challenge in challenges:
@@ -181,170 +332,295 @@ def run_benchmark(
     logger.info("Running %d total benchmark combinations", total_runs)
     
     if dry_run:
-        print("\n=== DRY RUN MODE ===\n")
-        print("Would run the following benchmarks:\n")
+        # Assemble the whole report and emit it with a single write
+        lines = ["\n=== DRY RUN MODE ===\n\n", "Would run the following benchmarks:\n\n"]
         for challenge in challenges:
             for model in config.models:
-                output_dir = get_model_output_dir(challenge, model, config.api)
-                print(f"  • {challenge.name} × {model}")
-                print(f"    Output: {output_dir}")
-        print(f"\nTotal: {total_runs} benchmark runs")
-        print("\nNo API calls will be made in dry-run mode.")
-        return results
-    
-    # Run benchmarks - use parallel execution for all models per challenge
-    for challenge_idx, challenge in enumerate(challenges, 1):
-        logger.info(
-            "[Challenge %d/%d] Running: %s with %d models",
-            challenge_idx, len(challenges), challenge.name, len(config.models)
-        )
+                # Path only: a dry run must not create or clear directories
+                output_dir = model_output_path(challenge, model, api_cfg)
+                lines.append(f"  • {challenge.name} × {model}\n    Output: {output_dir}\n")
+        lines.append(f"\nTotal: {total_runs} benchmark runs\n")
+        lines.append("\nNo API calls will be made in dry-run mode.\n")
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+        return list(all_results.values())
+    
+    # Finish deleting attempts a previous run was interrupted while removing
+    sweep_scratch_dir(scratch_dir)
+    
+    # Prepare user prompts with reference images if present
+    prompts = {challenge.name: prepare_user_prompt(challenge) for challenge in challenges}
+    
+    # Resolve output directories (and the files inside them) once up front so
+    # the per-model bookkeeping and render callbacks reuse them instead of
+    # repeating the filesystem work (and re-resetting the directory)
+    attempt_paths: dict[tuple[str, str], AttemptPaths] = {}
+    cache_keys: dict[tuple[str, str], str] = {}
+    
+    for challenge in challenges:
+        for model in config.models:
+            key = (challenge.name, model)
+            cache_keys[key] = attempt_cache_key(prompts[challenge.name], model, config)
+            
+            output_dir = model_output_path(challenge, model, api_cfg)
+            paths = attempt_paths[key] = AttemptPaths.from_output_dir(output_dir)
+            
+            # Keep the existing directory if it already holds this exact attempt
+            if resume and is_attempt_complete(paths, cache_keys[key]):
+                logger.info("Skipping %s × %s (already rendered)", challenge.name, model)
+                all_results[key] = BenchmarkResult(
+                    challenge=challenge.name,
+                    model=model,
+                    api_success=True,
+                    render_success=True,
+                )
+                continue
+            
+            prepare_model_output_dir(output_dir, scratch_dir=scratch_dir)
+    
+    def on_render_complete(key: tuple[str, str], render_result) -> None:
+        """Handle a finished render for a (challenge, model) pair."""
+        challenge_name, model = key
+        result = all_results[key]
+        result.render_success = render_result.success
+        result.render_time = render_result.render_time
         
-        # Prepare user prompt with reference image if present
-        user_prompt = prepare_user_prompt(challenge)
+        if render_result.success:
+            logger.info(
+                "✓ Success: %s × %s (render: %.2fs)",
+                challenge_name, model, render_result.render_time
+            )
+        else:
+            error = result.error_message = render_result.error_message
+            logger.warning("✗ Render failed: %s × %s - %s", challenge_name, model, error)
+            
+            # Save render error to log: the body is built and encoded once and
+            # written as bytes in a single call, without a text-mode wrapper
+            body = (
+                f"Render Error at {batch_ts}\n"
+                f"Model: {model}\n"
+                f"Challenge: {challenge_name}\n"
+                f"Error: {error}\n"
+                f"SCAD file: {render_result.scad_path}\n"
+            ).encode("utf-8")
+            pending_writes.append(file_writer.submit(
+                Path(attempt_paths[key].render_error_log).write_bytes, body
+            ))
+    
+    def report_animation(key: tuple[str, str], future: Future) -> None:
+        """Log the outcome of an animation generated in the animation stage."""
+        try:
+            anim_result = future.result()
+        except Exception as e:
+            logger.error("Unexpected error during animation generation: %s", e)
+            return
         
-        # Run all models in parallel for this challenge
-        model_statuses = run_models_parallel(
-            challenge_name=challenge.name,
-            challenge_prompt=user_prompt,
-            models=config.models,
-            config=config,
-        )
+        if anim_result.success:
+            logger.info(
+                "✓ Animation created: %s (%.2fs)",
+                anim_result.output_path, anim_result.animation_time
+            )
+        else:
+            logger.warning("✗ Animation failed: %s × %s - %s", *key, anim_result.error)
+    
+    # Attempts handed to the render stage
+    queued_renders: list[tuple[str, str]] = []
+    completed_renders: list[tuple[tuple[str, str], object]] = []
+    animations: list[tuple[tuple[str, str], Future]] = []
+    animation_enabled = bool(anim_cfg and anim_cfg.enabled)
+    
+    # Renders run in a background stage fed through a queue, so OpenSCAD works
+    # on challenge k while the API calls for challenge k+1 are in flight.
+    # Wall time moves from sum(api + render) towards max(sum api, sum render).
+    render_queue: queue.Queue = queue.Queue()
+    
+    # Small bookkeeping files (params.json, response.json, error logs) go
+    # through a single writer thread and are drained once per challenge, so
+    # slow or network-mounted storage doesn't stall the orchestration loop
+    pending_writes: list[Future] = []
+    
+    # Animations are their own stage: each STL is handed over the moment its
+    # render finishes, so frame capture and encoding overlap the remaining API
+    # calls and renders. VTK/OpenGL rendering isn't thread-safe, so the stage
+    # has a single worker that owns all offscreen plotting.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-stage") as render_stage, \
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-writer") as file_writer, \
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="animation") as animator:
         
-        # Prepare render tasks and process API responses
-        render_tasks: list[tuple[str, Path, str]] = []
-        model_results: dict[str, BenchmarkResult] = {}
+        def on_render_done(key: tuple[str, str], render_result) -> None:
+            # Runs on the render callback thread; reporting waits for the main thread
+            completed_renders.append((key, render_result))
+            if animation_enabled and render_result.success and render_result.stl_path:
+                animations.append((key, animator.submit(
+                    animate_stl,
+                    stl_path=render_result.stl_path,
+                    duration=anim_cfg.duration,
+                    fps=anim_cfg.fps,
+                    resolution=tuple(anim_cfg.resolution),
+                    render_scale=anim_cfg.render_scale,
+                    symmetric=anim_cfg.symmetric,
+                    codec=anim_cfg.codec,
+                    ffmpeg_path=anim_cfg.ffmpeg_path,
+                )))
         
-        for model, status in model_statuses.items():
-            # Get output directory for this attempt
-            output_dir = get_model_output_dir(challenge, model, config.api)
-            
-            # Save params.json documenting this run's configuration
-            save_params_json(output_dir, model, config.api)
-            
-            api_success = False
-            render_success = False
-            error_message = None
-            render_time = None
-            
-            if status.status == "done" and status.response is not None:
-                # API call succeeded - save response and prepare for rendering
-                api_success = True
+        render_future = render_stage.submit(
+            process_renders_parallel,
+            render_tasks=iter(render_queue.get, None),
+            openscad_path=openscad,
+            max_workers=render_workers,
+            timeout=1200.0,
+            on_complete=on_render_done,
+            use_processes=config.render_processes,
+            cache_dir=render_cache_dir,
+        )
+        
+        try:
+            # Run API calls - use parallel execution for all models per challenge
+            for challenge_idx, challenge in enumerate(challenges, 1):
+                # Attempts restored from a previous run already have a result
+                models = [m for m in config.models if (challenge.name, m) not in all_results]
+                if not models:
+                    logger.info(
+                        "[Challenge %d/%d] Skipping: %s (all models already rendered)",
+                        challenge_idx, len(challenges), challenge.name
+                    )
+                    continue
+                
+                logger.info(
+                    "[Challenge %d/%d] Running: %s with %d models",
+                    challenge_idx, len(challenges), challenge.name, len(models)
+                )
                 
-                # Save raw response for debugging
-                save_raw_response(output_dir, status.response)
+                # Run all models in parallel for this challenge
+                model_statuses = run_models_parallel(
+                    challenge_name=challenge.name,
+                    challenge_prompt=prompts[challenge.name],
+                    models=models,
+                    config=config,
+                )
+                
+                # Process API responses and queue render tasks
+                queued = 0
                 
-                try:
-                    # Extract code from response
-                    code = extract_code(status.response)
-                    logger.debug("Successfully extracted code (%d bytes) for %s", len(code), model)
+                for model, status in model_statuses.items():
+                    key = (challenge.name, model)
                     
-                    # Add to render tasks for parallel processing
-                    render_tasks.append((model, output_dir, code))
+                    # Get output directory for this attempt
+                    paths = attempt_paths[key]
                     
-                except ValueError as e:
-                    error_message = f"Failed to extract code: {e}"
-                    logger.error(error_message)
                     api_success = False
+                    render_success = False
+                    error_message = None
+                    render_time = None
+                    code = None
                     
-            elif status.status == "error":
-                # API call failed
-                error_message = status.error_message or "Unknown API error"
-                logger.error("API error for %s: %s", model, error_message)
-                
-                # Save error to log file
-                error_file = output_dir / "error.log"
-                with open(error_file, 'w', encoding='utf-8') as f:
-                    f.write(f"API Error at {datetime.now().isoformat()}\n")
-                    f.write(f"Model: {model}\n")
-                    f.write(f"Challenge: {challenge.name}\n")
-                    f.write(f"Error: {error_message}\n")
-            
-            # Store initial result (will update render status after parallel rendering)
-            model_results[model] = BenchmarkResult(
-                challenge=challenge.name,
-                model=model,
-                api_success=api_success,
-                render_success=render_success,
-                error_message=error_message,
-                render_time=render_time
-            )
-        
-        # Process renders in parallel (max 5 threads)
-        if render_tasks:
-            logger.info("Rendering %d models in parallel (max 5 threads)", len(render_tasks))
-            
-            def on_render_complete(model: str, render_result) -> None:
-                """Callback when a render completes."""
-                result = model_results[model]
-                result.render_success = render_result.success
-                result.render_time = render_result.render_time
-                
-                if render_result.success:
-                    logger.info(
-                        "✓ Success: %s × %s (render: %.2fs)",
-                        challenge.name, model, render_result.render_time
-                    )
-                    
-                    # Generate animation if enabled
-                    if config.animation and config.animation.enabled and render_result.stl_path:
+                    if status.status == "done" and status.response is not None:
+                        # API call succeeded - save response and prepare for rendering
+                        api_success = True
+                        
+                        # Save raw response for debugging
+                        pending_writes.append(file_writer.submit(save_raw_response, paths, status.response))
+                        
+                        # Save params.json documenting this run's configuration. Failed
+                        # API calls only get an error.log, so they skip this write.
+                        pending_writes.append(file_writer.submit(
+                            save_params_json, paths.output_dir, model, api_cfg, cache_keys[key]
+                        ))
+                        
                         try:
-                            logger.info("Generating animation for %s", render_result.stl_path)
-                            anim_result = animate_stl(
-                                stl_path=render_result.stl_path,
-                                duration=config.animation.duration,
-                                fps=config.animation.fps,
-                                resolution=tuple(config.animation.resolution),
-                                ffmpeg_path=config.animation.ffmpeg_path
-                            )
+                            # Extract code from response
+                            code = extract_code(status.response)
+                            logger.debug("Successfully extracted code (%d bytes) for %s", len(code), model)
+                        except ValueError as e:
+                            error_message = f"Failed to extract code: {e}"
+                            logger.error(error_message)
+                            api_success = False
+                        
+                        # The response is queued for saving and the code extracted,
+                        # so don't keep the full payload alive for the rest of the run
+                        status.response = None
                             
-                            if anim_result.success:
-                                logger.info(
-                                    "✓ Animation created: %s (%.2fs)",
-                                    anim_result.output_path, anim_result.animation_time
-                                )
-                            else:
-                                logger.warning(
-                                    "✗ Animation failed: %s", anim_result.error
-                                )
-                        except Exception as e:
-                            logger.error("Unexpected error during animation generation: %s", e)
-                else:
-                    result.error_message = render_result.error_message
-                    logger.warning(
-                        "✗ Render failed: %s × %s - %s",
-                        challenge.name, model, render_result.error_message
+                    elif status.status == "error":
+                        # API call failed
+                        error_message = status.error_message or "Unknown API error"
+                        logger.error("API error for %s: %s", model, error_message)
+                        
+                        # Save error to log file
+                        pending_writes.append(file_writer.submit(
+                            write_text_file,
+                            paths.error_log,
+                            f"API Error at {batch_ts}\n"
+                            f"Model: {model}\n"
+                            f"Challenge: {challenge.name}\n"
+                            f"Error: {error_message}\n"
+                        ))
+                    
+                    # Store initial result (render status is filled in by the render stage)
+                    all_results[key] = BenchmarkResult(
+                        challenge=challenge.name,
+                        model=model,
+                        api_success=api_success,
+                        render_success=render_success,
+                        error_message=error_message,
+                        render_time=render_time
                     )
                     
-                    # Save render error to log
-                    output_dir = get_model_output_dir(challenge, model, config.api)
-                    error_file = output_dir / "render_error.log"
-                    with open(error_file, 'w', encoding='utf-8') as f:
-                        f.write(f"Render Error at {datetime.now().isoformat()}\n")
-                        f.write(f"Model: {model}\n")
-                        f.write(f"Challenge: {challenge.name}\n")
-                        f.write(f"Error: {render_result.error_message}\n")
-                        f.write(f"SCAD file: {render_result.scad_path}\n")
-            
-            try:
-                process_renders_parallel(
-                    render_tasks=render_tasks,
-                    openscad_path=config.openscad_path,
-                    max_workers=5,
-                    timeout=1200.0,
-                    on_complete=on_render_complete,
-                )
-            except Exception as e:
-                logger.exception("Unexpected error during parallel rendering")
-                # Update any models that didn't get processed
-                for model, _, _ in render_tasks:
-                    result = model_results[model]
-                    if not result.render_success and result.error_message is None:
-                        result.error_message = f"Unexpected render error: {e}"
+                    if code is not None:
+                        # Hand off to the render stage
+                        queued_renders.append(key)
+                        render_queue.put((key, paths.output_dir, code))
+                        queued += 1
+                
+                if queued:
+                    logger.info(
+                        "Queued %d renders for %s (max %d at a time)",
+                        queued, challenge.name, render_workers
+                    )
+                
+                # Make sure this challenge's bookkeeping files are on disk
+                drain_writes(pending_writes)
+        finally:
+            # Always terminate the render stage's task stream
+            render_queue.put(None)
+            # All API calls are done; stop the model workers and drop the
+            # pooled keep-alive connections
+            shutdown_model_pool()
+            close_session()
         
-        # Add all results to the results list
-        results.extend(model_results.values())
-    
-    return results
+        render_error = None
+        try:
+            render_future.result()
+        except (subprocess.SubprocessError, OSError) as e:
+            # Per-render failures come back as RenderResults, so this is the
+            # stage itself failing; the traceback is only shown with --verbose
+            logger.error("Render stage failed: %r", e, exc_info=verbose)
+            render_error = e
+        except Exception as e:
+            logger.exception("Unexpected error during parallel rendering")
+            render_error = e
+        
+        if render_error is not None:
+            # Update any models that didn't get processed
+            processed = {key for key, _ in completed_renders}
+            for key in queued_renders:
+                if key not in processed:
+                    all_results[key].error_message = f"Unexpected render error: {render_error}"
+        
+        # Report finished renders outside the Live display
+        for key, render_result in completed_renders:
+            on_render_complete(key, render_result)
+        drain_writes(pending_writes)
+        
+        if animations:
+            logger.info("Waiting for %d animations", len(animations))
+        for key, future in animations:
+            report_animation(key, future)
+        if animations:
+            # Release the pooled plotters on the thread that created them
+            animator.submit(shutdown_animator).result()
+    
+    # Report in (challenge, model) order, including attempts restored by --resume
+    return [all_results[key] for key in attempt_paths if key in all_results]
 
 
 def main():
@@ -357,10 +633,13 @@ Examples:
   %(prog)s                      Run all benchmarks using config.yaml
   %(prog)s --config my.yaml     Use custom config file
   %(prog)s --dry-run            Show what would run without calling APIs
+  %(prog)s --resume             Skip attempts already rendered by a previous run
+  %(prog)s --no-cache           Don't reuse cached API responses or renders
   %(prog)s --verbose            Enable verbose logging
 
 Environment Variables:
   OPENROUTER_API_KEY           Required API key for OpenRouter
+  OPENSCAD_BENCH_MAX_WORKERS   Concurrent OpenSCAD renders (default: CPU cores - 1)
         """
     )
     
@@ -376,6 +655,21 @@ Environment Variables:
         help="Show what would be run without actually calling APIs"
     )
     
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip (challenge, model) attempts that a previous run already rendered "
+             "with the same prompt, model and parameters"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't reuse cached renders of identical code (kept in {RENDER_CACHE_DIR}/) "
+             "or, if api.cache_responses is on, in-process responses to repeated "
+             "deterministic requests (seed set, temperature 0)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -395,7 +689,9 @@ Environment Variables:
     results = run_benchmark(
         config_path=args.config,
         dry_run=args.dry_run,
-        verbose=args.verbose
+        verbose=args.verbose,
+        resume=args.resume,
+        no_cache=args.no_cache
     )
     
     # Print summary (only if not dry run)
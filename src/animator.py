@@ -4,17 +4,124 @@ Animator module for generating rotating MP4 animations from STL files using vedo
 
 import logging
 import os
+import subprocess
+import tempfile
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from queue import Queue
+from threading import Thread
 from typing import Optional
 
 import numpy as np
 import vedo
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkUnsignedCharArray
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Encoder-specific ffmpeg options. These are short preview clips, so favour
+# encode speed: a fast x264 preset with one thread per core, or the fastest
+# hardware presets. All produce H.264 in an MP4 container.
+ENCODER_PARAMS: dict[str, list[str]] = {
+    "libx264": ["-preset", "veryfast", "-threads", str(os.cpu_count() or 4)],
+    "h264_nvenc": ["-preset", "p1", "-tune", "ll"],
+    "h264_qsv": ["-preset", "veryfast"],
+}
+
+# Hardware encoders tried, in order, for codec="auto" before falling back to x264
+_HARDWARE_ENCODERS = ("h264_nvenc", "h264_qsv")
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(ffmpeg: str, codec: str) -> bool:
+    """Check once whether ``ffmpeg`` can actually encode with ``codec``.
+
+    ffmpeg builds often list NVENC/QSV without a usable GPU behind them, so
+    this runs a tiny test encode rather than grepping ``ffmpeg -encoders``.
+    """
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                "-c:v", codec, "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+
+def resolve_codec(codec: str, ffmpeg: str = "ffmpeg") -> str:
+    """Map ``"auto"`` to the first working hardware H.264 encoder, else libx264."""
+    if codec != "auto":
+        return codec
+    for candidate in _HARDWARE_ENCODERS:
+        if _encoder_works(ffmpeg, candidate):
+            logger.info("Using hardware encoder %s for animations", candidate)
+            return candidate
+    return "libx264"
+
+
+# Offscreen plotters reused across animations, keyed on (size, background).
+# Creating one allocates a VTK render window and OpenGL context, so this is paid
+# once per distinct size rather than once per STL. Not thread-safe: all calls
+# must come from the same thread (VTK rendering is single-threaded anyway).
+_PLOTTERS: dict[tuple[tuple[int, int], str], "vedo.Plotter"] = {}
+
+
+def _get_plotter(size: tuple[int, int], bg: str) -> "vedo.Plotter":
+    """Return a pooled offscreen plotter, cleared and with a default camera."""
+    key = (tuple(size), bg)
+    plt = _PLOTTERS.get(key)
+    if plt is None:
+        plt = _PLOTTERS[key] = vedo.Plotter(offscreen=True, size=size, bg=bg)
+    else:
+        plt.clear()
+        # Undo the previous orbit; show() re-fits this default view to the mesh
+        camera = plt.camera
+        camera.SetPosition(0, 0, 1)
+        camera.SetFocalPoint(0, 0, 0)
+        camera.SetViewUp(0, 1, 0)
+    return plt
+
+
+def _discard_plotter(plt: "vedo.Plotter") -> None:
+    """Drop a plotter from the pool (e.g. after a failed animation) and close it."""
+    for key, pooled in list(_PLOTTERS.items()):
+        if pooled is plt:
+            del _PLOTTERS[key]
+    plt.close()
+
+
+def shutdown_animator() -> None:
+    """Close all pooled plotters.
+
+    Call once after the last animation, from the thread that generated them.
+    """
+    while _PLOTTERS:
+        _, plt = _PLOTTERS.popitem()
+        plt.close()
+
+
+@lru_cache(maxsize=8)
+def _load_polydata(path: str, mtime_ns: int):
+    """Parse an STL once and cache its vtkPolyData.
+
+    Keyed on the file's modification time so a re-rendered STL is reloaded.
+    The raw dataset is cached rather than a Mesh, since actors carry per-plot
+    state (color, transforms) that must not leak between animations.
+    """
+    mesh = vedo.load(path)
+    if mesh is None:
+        raise ValueError(f"Failed to load mesh from {path}")
+    return mesh.dataset
+
 
 @dataclass
 class AnimationResult:
@@ -32,6 +139,9 @@ def animate_stl(
     fps: int = 30,
     resolution: tuple[int, int] = (720, 720),
     ffmpeg_path: Optional[str] = None,
+    render_scale: float = 1.0,
+    symmetric: bool = False,
+    codec: str = "libx264",
 ) -> AnimationResult:
     """
     Generates a rotating MP4 animation from an STL file.
@@ -43,6 +153,16 @@ def animate_stl(
         fps: Frames per second (default: 30).
         resolution: Tuple of (width, height) for output video (default: (720, 720)).
         ffmpeg_path: Optional path to ffmpeg executable.
+        render_scale: Fraction of the resolution to render at (default: 1.0). Values
+            below 1 shade proportionally fewer pixels and encode smaller frames, and
+            ffmpeg upscales the result to ``resolution``, trading sharpness for speed.
+        symmetric: Set for meshes that look the same after a 180° turn about the
+            vertical axis (default: False). Only half the orbit is rendered, with
+            the elevation wave completing a full cycle in each half, and the
+            frames are written twice, halving the rendering work.
+        codec: H.264 encoder to use: "libx264" (default, CPU), "h264_nvenc",
+            "h264_qsv", or "auto" to pick a working hardware encoder if present.
+            Hardware encoders free the CPU cores for rendering.
 
     Returns:
         AnimationResult dataclass with success status, output path, error message, and animation time.
@@ -59,23 +179,24 @@ def animate_stl(
 
     logger.info(f"Starting animation generation for {stl_path}")
 
+    plt = None
     try:
         if not stl_path.exists():
             raise FileNotFoundError(f"STL file not found: {stl_path}")
 
-        # Configure ffmpeg path if provided
-        if ffmpeg_path:
-            # Add ffmpeg directory to PATH so vedo/imageio can find it
-            ffmpeg_dir = str(Path(ffmpeg_path).parent)
-            os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ["PATH"]
+        ffmpeg = ffmpeg_path or "ffmpeg"
 
-        # Initialize vedo plotter
-        plt = vedo.Plotter(offscreen=True, size=resolution, bg="#1e1e1e")
+        # Initialize vedo plotter, optionally with a smaller framebuffer
+        render_size = resolution
+        if render_scale < 1.0:
+            render_size = (
+                max(16, round(resolution[0] * render_scale)),
+                max(16, round(resolution[1] * render_scale)),
+            )
+        plt = _get_plotter(render_size, "#1e1e1e")
 
-        # Load mesh
-        mesh = vedo.load(str(stl_path))
-        if mesh is None:
-            raise ValueError(f"Failed to load mesh from {stl_path}")
+        # Load mesh (parsed geometry is shared across calls for the same file)
+        mesh = vedo.Mesh(_load_polydata(str(stl_path), stl_path.stat().st_mtime_ns))
 
         mesh.c("#168FFF")
         plt += mesh
@@ -85,70 +206,155 @@ def animate_stl(
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use imageio backend which is more reliable on Windows than ffmpeg backend
-        # (vedo's ffmpeg backend uses os.system with single quotes which fails on Windows)
-        # We must manually write the video using imageio to specify the codec and parameters for MP4 output
-        # because vedo.Video doesn't pass extra arguments to imageio.get_writer
-        import imageio
-        
-        vid = vedo.Video(
-            str(output_path),
-            duration=duration,
-            fps=fps,
-            backend="imageio"
-        )
-
         # Generate tilted ring camera orbit (electron style)
         # Azimuth: Linear 0->360
         # Elevation: Sinusoidal +/- 45 degrees, 1 full cycle
         # Note: Since we want it to move "half as slow" but duration is doubled (6s),
         # we still want exactly one full rotation (360 deg) over the full duration.
-        n_frames = int(fps * duration)
-        azimuths = np.linspace(0, 360, n_frames, endpoint=False)
-        elevations = 45 * np.sin(np.linspace(0, 2 * np.pi, n_frames, endpoint=False))
+        # For symmetric meshes the second half of the orbit repeats the first
+        repeat = 2 if symmetric else 1
+        n_frames = int(fps * duration) // repeat
+        # float32 is plenty for camera angles; the sine is taken in place
+        azimuths = np.linspace(0, 360 / repeat, n_frames, endpoint=False, dtype=np.float32)
+        elevations = np.linspace(0, 2 * np.pi, n_frames, endpoint=False, dtype=np.float32)
+        np.sin(elevations, out=elevations)
+        elevations *= 45.0
 
-        current_azimuth = 0.0
-        current_elevation = 0.0
+        # Place the camera absolutely each frame instead of chaining incremental
+        # Azimuth/Elevation rotations: no accumulated drift and a single
+        # SetPosition per frame. As those calls did, azimuth turns about the
+        # initial view-up axis and elevation tilts towards it, at a fixed
+        # distance from the focal point. All positions are computed up front.
+        camera = plt.camera
+        focal = np.array(camera.GetFocalPoint())
+        offset = np.array(camera.GetPosition()) - focal
+        distance = np.linalg.norm(offset)
+        forward = offset / distance
+        up = np.array(camera.GetViewUp(), dtype=float)
+        up -= up.dot(forward) * forward
+        up /= np.linalg.norm(up)
+        right = np.cross(up, forward)
 
-        for i in range(n_frames):
-            # Calculate deltas relative to current position
-            d_az = azimuths[i] - current_azimuth
-            d_el = elevations[i] - current_elevation
+        az = np.deg2rad(azimuths)
+        el = np.deg2rad(elevations)
+        cos_el = np.cos(el)
+        positions = (
+            focal
+            + distance * (
+                np.outer(cos_el * np.sin(az), right)
+                + np.outer(np.sin(el), up)
+                + np.outer(cos_el * np.cos(az), forward)
+            )
+        ).tolist()
 
-            plt.camera.Azimuth(d_az)
-            plt.camera.Elevation(d_el)
-            plt.render()
-            vid.add_frame()
+        codec = resolve_codec(codec, ffmpeg)
+        if codec not in ENCODER_PARAMS:
+            raise ValueError(f"Unsupported animation codec: {codec}")
 
-            current_azimuth = azimuths[i]
-            current_elevation = elevations[i]
-        
-        # Manually write frames to video file with correct codec and X-optimized settings
-        writer = imageio.get_writer(
-            str(output_path), 
-            fps=fps, 
-            codec="libx264",
-            output_params=[
-                "-profile:v", "high", 
-                "-pix_fmt", "yuv420p", 
-                "-b:v", "2048k"
-            ]
-        )
-        for f in vid.frames:
-            writer.append_data(imageio.imread(f))
-        writer.close()
-        
-        # Cleanup temporary directory created by vedo
-        vid.tmp_dir.cleanup()
-        
-        # We don't call vid.close() because we already wrote the video and cleaned up
+        # Pixels are read back into a fixed ring of buffers instead of a fresh
+        # array per screenshot. The ring outnumbers the frames that can be in
+        # flight (queued + being encoded + being captured), so a buffer is only
+        # refilled once the encoder is done with it.
+        queue_size = 8
+        window = plt.window
+        width, height = window.GetSize()
+        ring = [vtkUnsignedCharArray() for _ in range(queue_size + 2)]
+        # Frames to write again; these must outlive the ring, so they're copies
+        replay: list[np.ndarray] | None = [] if repeat > 1 else None
+
+        # Raw frames are piped straight into ffmpeg, in VTK's bottom-up row order
+        # so each buffer is written without a copy; ffmpeg flips them and scales
+        # to the output size (libx264 with yuv420p needs even dimensions). This
+        # avoids vedo.Video, which PNG-encodes every frame to a temp dir (and
+        # whose ffmpeg backend uses os.system with single quotes, which fails on
+        # Windows), as well as imageio's per-frame checks and copies.
+        out_width, out_height = (dim + dim % 2 for dim in resolution)
+        # ffmpeg's stderr goes to a temporary file rather than a pipe: nothing
+        # reads it until every frame is written, and a full pipe would block
+        # ffmpeg while the encoder thread blocks writing frames to it
+        ffmpeg_log = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                [
+                    ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+                    "-f", "rawvideo", "-pix_fmt", "rgb24",
+                    "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                    "-an", "-vf", f"vflip,scale={out_width}:{out_height}",
+                    "-c:v", codec,
+                    "-profile:v", "high",
+                    "-pix_fmt", "yuv420p",
+                    "-b:v", "2048k",
+                    *ENCODER_PARAMS[codec],
+                    str(output_path),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=ffmpeg_log,
+            )
+        except OSError:
+            ffmpeg_log.close()
+            raise
+
+        # Encode on a background thread so rendering frame i+1 overlaps encoding
+        # frame i; the bounded queue keeps at most a few frames in memory
+        frames: Queue = Queue(maxsize=queue_size)
+        encode_errors: list[BaseException] = []
+
+        def encode_frames() -> None:
+            while (frame := frames.get()) is not None:
+                if encode_errors:
+                    continue  # keep draining so the producer never blocks
+                try:
+                    proc.stdin.write(memoryview(frame))
+                except OSError as e:
+                    encode_errors.append(e)
+
+        encoder = Thread(target=encode_frames, name="animation-encoder", daemon=True)
+        encoder.start()
+        try:
+            for i, position in enumerate(positions):
+                if encode_errors:
+                    break
+
+                camera.SetPosition(*position)
+                plt.render()
+
+                buffer = ring[i % len(ring)]
+                window.GetPixelData(0, 0, width - 1, height - 1, 0, buffer)
+                frame = vtk_to_numpy(buffer)
+                if replay is not None:
+                    frame = frame.copy()
+                    replay.append(frame)
+                frames.put(frame)
+
+            for _ in range(repeat - 1):
+                for frame in replay:
+                    if encode_errors:
+                        break
+                    frames.put(frame)
+        finally:
+            frames.put(None)
+            encoder.join()
+            # Closes stdin so ffmpeg finalizes the file, then waits for it
+            proc.communicate()
+            with ffmpeg_log:
+                ffmpeg_log.seek(0)
+                stderr = ffmpeg_log.read()
+
+        if proc.returncode != 0:
+            message = stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(
+                f"ffmpeg exited with code {proc.returncode}: {message or 'no error output'}"
+            )
+        if encode_errors:
+            raise encode_errors[0]
         
-        plt.close()
+        # The plotter stays in the pool for the next animation
 
         elapsed_time = time.perf_counter() - start_time
         
         # Verify the output file was actually created and has content
-        # vedo doesn't raise exceptions when ffmpeg fails, so we must check manually
+        # A clean ffmpeg exit doesn't guarantee a usable file, so check it manually
         if not output_path.exists():
             raise RuntimeError(f"Animation file was not created: {output_path}")
         
@@ -169,6 +375,9 @@ def animate_stl(
         )
 
     except Exception as e:
+        if plt is not None:
+            # Don't hand a plotter in an unknown state to the next animation
+            _discard_plotter(plt)
         elapsed_time = time.perf_counter() - start_time
         error_msg = str(e)
         logger.error(f"Failed to generate animation for {stl_path}: {error_msg}")
@@ -2,11 +2,18 @@
 
 import base64
 import logging
+import os
 import shutil
+import stat
+import sys
+import threading
+import uuid
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Collection, Mapping, Sequence, Union
 
 if TYPE_CHECKING:
     from config import ApiConfig
@@ -45,61 +52,76 @@ def discover_challenges(base_path: Path) -> list[Challenge]:
         
     Raises:
         ChallengeError: If challenges directory doesn't exist.
+    
+    Note:
+        Results are memoized on the challenges directory's modification time,
+        which changes when challenges are added, removed or renamed. Edits to
+        an existing prompt.md are not picked up within the same process.
     """
     challenges_dir = base_path / "challenges"
     
-    if not challenges_dir.exists():
+    try:
+        st = challenges_dir.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise ChallengeError(f"Challenges directory not found: {challenges_dir}")
     
-    if not challenges_dir.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise ChallengeError(f"Challenges path is not a directory: {challenges_dir}")
     
-    challenges = []
-    
-    for entry in challenges_dir.iterdir():
-        # Skip non-directories
-        if not entry.is_dir():
-            continue
-        
-        # Skip TEMPLATE directory
-        if entry.name == "TEMPLATE":
-            continue
-        
-        # Check for prompt.md
-        prompt_file = entry / "prompt.md"
-        if not prompt_file.exists():
-            continue
-        
-        # Read the prompt content
-        try:
-            prompt_content = prompt_file.read_text(encoding="utf-8").strip()
-        except IOError as e:
-            raise ChallengeError(f"Failed to read prompt for challenge '{entry.name}': {e}")
-        
-        challenges.append(Challenge(
-            name=entry.name,
-            prompt=prompt_content,
-            path=entry,
-        ))
+    return list(_discover_cached(str(challenges_dir), st.st_mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _discover_cached(challenges_dir: str, mtime_ns: int) -> tuple[Challenge, ...]:
+    """Scan a challenges directory; cached per (directory, mtime_ns)."""
+    # scandir entries carry their type from the directory listing, so picking
+    # out candidate directories doesn't stat each one again
+    with os.scandir(challenges_dir) as it:
+        entries = [
+            entry for entry in it
+            if entry.name != "TEMPLATE" and entry.is_dir()
+        ]
+    
+    # Prompts are independent small reads; fetch them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        prompts = list(executor.map(_read_prompt, entries))
+    
+    challenges = [
+        Challenge(name=entry.name, prompt=prompt, path=Path(entry.path))
+        for entry, prompt in zip(entries, prompts)
+        # Directories without a prompt.md aren't challenges
+        if prompt is not None
+    ]
     
     # Sort by name
     challenges.sort(key=lambda c: c.name)
     
-    return challenges
+    return tuple(challenges)
+
+
+def _read_prompt(entry: os.DirEntry) -> str | None:
+    """Read a challenge directory's prompt.md, or None if it has none."""
+    try:
+        with open(os.path.join(entry.path, "prompt.md"), encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+    except IOError as e:
+        raise ChallengeError(f"Failed to read prompt for challenge '{entry.name}': {e}")
 
 
 def filter_challenges(
     challenges: list[Challenge],
-    filter_list: list[str] | str,
-    exclude_list: list[str] | None = None
+    filter_list: Sequence[str] | str,
+    exclude_list: Collection[str] | None = None
 ) -> list[Challenge]:
     """Filter challenges by name, optionally excluding specific ones.
     
     Args:
         challenges: List of all available challenges.
-        filter_list: Either "all" to return all challenges, or a list of
+        filter_list: Either "all" to return all challenges, or a sequence of
             challenge names to filter to.
-        exclude_list: Optional list of challenge names to exclude. Only applies
+        exclude_list: Optional collection of challenge names to exclude. Only applies
             when filter_list is "all". If a challenge is in exclude_list but
             doesn't exist, a warning is issued.
             
@@ -118,7 +140,7 @@ def filter_challenges(
         # Apply exclusion filter if provided
         if exclude_list:
             # Validate that excluded challenges exist and warn if not
-            for name in exclude_list:
+            for name in sorted(exclude_list):
                 if name not in available:
                     warnings.warn(
                         f"Excluded challenge '{name}' does not exist. "
@@ -126,16 +148,14 @@ def filter_challenges(
                         UserWarning
                     )
             
-            # Filter out excluded challenges
-            result = [c for c in result if c.name not in exclude_list]
+            # Filter out excluded challenges (set lookup rather than a list scan)
+            excluded = frozenset(exclude_list)
+            result = [c for c in result if c.name not in excluded]
         
         return result
     
-    # Check that all requested challenges exist
-    missing = []
-    for name in filter_list:
-        if name not in available:
-            missing.append(name)
+    # Check that all requested challenges exist, keeping the requested order
+    missing = [name for name in filter_list if name not in available]
     
     if missing:
         available_names = sorted(available.keys())
@@ -148,6 +168,7 @@ def filter_challenges(
     return [available[name] for name in filter_list]
 
 
+@lru_cache(maxsize=512)
 def sanitize_model_name(model: str) -> str:
     """Convert a model ID to a filesystem-safe name.
     
@@ -188,55 +209,25 @@ def generate_param_suffix(api_config: "ApiConfig") -> str:
     if not non_default:
         return ""
     
-    # Define abbreviations for common parameters
-    param_abbrevs = {
-        "temperature": "temp",
-        "top_p": "topp",
-        "top_k": "topk",
-        "frequency_penalty": "freqp",
-        "presence_penalty": "presp",
-        "repetition_penalty": "repp",
-        "min_p": "minp",
-        "top_a": "topa",
-        "seed": "seed",
-        "max_tokens": "maxt",
-        "reasoning": "reason",
-    }
-    
-    # Build suffix parts
-    parts = []
-    
-    for param, value in non_default.items():
-        if param not in param_abbrevs:
-            continue
-            
-        abbrev = param_abbrevs[param]
-        
-        if param == "reasoning":
-            # For reasoning, just indicate it's enabled
-            if isinstance(value, dict):
-                if "effort" in value:
-                    parts.append(f"reason-{value['effort']}")
-                elif "max_tokens" in value:
-                    parts.append(f"reason-{value['max_tokens']}")
-                else:
-                    parts.append("reason")
-            continue
-        
-        # Format numeric values compactly
-        if isinstance(value, float):
-            # Format as compact string: 0.7 → "07", 1.5 → "15"
-            if value == int(value):
-                formatted = str(int(value))
-            else:
-                # Remove decimal point for compactness
-                formatted = f"{value:.2f}".replace(".", "").lstrip("0") or "0"
-        elif isinstance(value, int):
-            formatted = str(value)
-        else:
-            formatted = str(value)
-        
-        parts.append(f"{abbrev}{formatted}")
+    # ApiConfig memoises the mapping until a setting changes, so the same
+    # object means the same parameters
+    global _last_suffix
+    cached = _last_suffix
+    if cached is not None and cached[0] is non_default:
+        return cached[1]
+    suffix = _build_param_suffix(non_default)
+    _last_suffix = (non_default, suffix)
+    return suffix
+
+
+def _build_param_suffix(non_default: Mapping) -> str:
+    """Build the folder suffix for a set of non-default parameters."""
+    parts = [
+        part
+        for param, value in non_default.items()
+        if (format_part := _SUFFIX_FORMATTERS.get(param)) is not None
+        and (part := format_part(value)) is not None
+    ]
     
     # If too many parts (more than 3), use "custom" instead
     if len(parts) > 3:
@@ -245,15 +236,68 @@ def generate_param_suffix(api_config: "ApiConfig") -> str:
     return "-".join(parts)
 
 
-def get_model_output_dir(
+def _format_compact(value: object) -> str:
+    """Format a parameter value compactly: 0.7 → "70", 1.0 → "1", 50 → "50"."""
+    if isinstance(value, float):
+        if value == int(value):
+            return str(int(value))
+        # Remove decimal point for compactness
+        return f"{value:.2f}".replace(".", "").lstrip("0") or "0"
+    return str(value)
+
+
+def _numeric_part(abbrev: str) -> Callable[[object], str]:
+    """Build a suffix formatter that prefixes a compact value with ``abbrev``."""
+    return lambda value: f"{abbrev}{_format_compact(value)}"
+
+
+def _reasoning_part(value: object) -> str | None:
+    """Format the reasoning setting; only dict configs contribute a part."""
+    if not isinstance(value, dict):
+        return None
+    if "effort" in value:
+        return f"reason-{value['effort']}"
+    if "max_tokens" in value:
+        return f"reason-{value['max_tokens']}"
+    return "reason"
+
+
+# The last generate_param_suffix result, with the non-default parameters
+# mapping it was built from (held so its identity can't be reused)
+_last_suffix: tuple[Mapping, str] | None = None
+
+# Suffix formatter per parameter, built once at import. Parameters missing
+# from the table don't contribute to the folder name.
+_SUFFIX_FORMATTERS: dict[str, Callable[[object], str | None]] = {
+    **{
+        param: _numeric_part(abbrev)
+        for param, abbrev in {
+            "temperature": "temp",
+            "top_p": "topp",
+            "top_k": "topk",
+            "frequency_penalty": "freqp",
+            "presence_penalty": "presp",
+            "repetition_penalty": "repp",
+            "min_p": "minp",
+            "top_a": "topa",
+            "seed": "seed",
+            "max_tokens": "maxt",
+        }.items()
+    },
+    "reasoning": _reasoning_part,
+}
+
+
+def model_output_path(
     challenge: Challenge,
     model: str,
     api_config: "ApiConfig | None" = None
 ) -> Path:
-    """Get the output directory for a model's challenge attempt.
+    """Get the output directory path for a model's challenge attempt.
     
     When non-default API parameters are used, the folder name includes a suffix
-    to distinguish runs with different configurations.
+    to distinguish runs with different configurations. This only computes the
+    path; use prepare_model_output_dir to create or reset the directory.
     
     Args:
         challenge: The challenge being attempted.
@@ -262,8 +306,7 @@ def get_model_output_dir(
             parameters, a suffix will be appended to the folder name.
         
     Returns:
-        Path to the model's output directory. The directory is created
-        if it doesn't exist.
+        Path to the model's output directory. The filesystem is not touched.
         
     Examples:
         - Base: challenges/box-lid/models/openai--gpt-4o/
@@ -278,16 +321,90 @@ def get_model_output_dir(
         if suffix:
             sanitized = f"{sanitized}--{suffix}"
     
-    output_dir = challenge.path / "models" / sanitized
+    return challenge.path / "models" / sanitized
+
+
+def prepare_model_output_dir(
+    output_dir: Path, reset: bool = True, scratch_dir: Path | None = None
+) -> Path:
+    """Create a model's output directory, optionally clearing a previous attempt.
     
-    # Remove existing directory if it exists, then create fresh
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
+    Args:
+        output_dir: Directory from model_output_path.
+        reset: If True (default), remove any existing contents so the attempt
+            starts from an empty directory. If False, existing files are kept.
+        scratch_dir: Optional directory outside the results tree (on the same
+            filesystem) where a previous attempt is moved to be deleted in the
+            background. Without it, the previous attempt is deleted before
+            returning.
+        
+    Returns:
+        The same directory, which now exists.
+    """
+    # Clear out any previous attempt, then create fresh
+    if reset and output_dir.exists():
+        if scratch_dir is None:
+            shutil.rmtree(output_dir)
+        else:
+            _remove_in_background(output_dir, scratch_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     return output_dir
 
 
+def sweep_scratch_dir(scratch_dir: Path) -> None:
+    """Delete, in the background, anything left in a scratch directory.
+    
+    Stashes normally delete themselves, but a crash or Ctrl-C mid-delete
+    leaves them behind; call this once at startup.
+    """
+    try:
+        leftovers = list(scratch_dir.iterdir())
+    except FileNotFoundError:
+        return
+    for path in leftovers:
+        _start_rmtree(path)
+
+
+def _remove_in_background(path: Path, scratch_dir: Path) -> None:
+    """Remove a directory tree without blocking the caller.
+    
+    The directory is renamed into scratch_dir first (a single, atomic rename
+    on the same filesystem), so ``path`` is free to be recreated immediately
+    while the recursive delete runs on a background thread. Falls back to a
+    synchronous delete if the rename isn't possible (e.g. a file is held open
+    on Windows, or scratch_dir is on another filesystem).
+    """
+    stash = scratch_dir / f"{path.name}-{uuid.uuid4().hex[:8]}"
+    try:
+        scratch_dir.mkdir(exist_ok=True)
+        path.rename(stash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    _start_rmtree(stash)
+
+
+def _start_rmtree(path: Path) -> None:
+    """Delete a directory tree on a background thread, logging any failures."""
+    def log_error(func: Callable, failed_path: str, exc) -> None:
+        # onexc passes the exception, onerror an exc_info tuple
+        error = exc[1] if isinstance(exc, tuple) else exc
+        logging.getLogger(__name__).warning("Failed to delete %s: %s", failed_path, error)
+    
+    # onerror is deprecated in favour of onexc from Python 3.12
+    handler = "onexc" if sys.version_info >= (3, 12) else "onerror"
+    
+    # Not a daemon, so interpreter shutdown waits for the delete to finish
+    # instead of leaving a half-removed stash behind
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={handler: log_error},
+        name=f"rmtree-{path.name}",
+    ).start()
+
+
 def prepare_user_prompt(challenge: Challenge) -> Union[str, list]:
     """Prepare user prompt content, including reference image if present.
     
@@ -2,13 +2,14 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Union
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional, Union
 import os
 import re
 import shutil
 
-import yaml
-from dotenv import load_dotenv
+# yaml and dotenv are imported where they're used (load_config and
+# load_api_key) so importing this module for the dataclasses stays cheap
 
 
 class ConfigError(Exception):
@@ -16,8 +17,13 @@ class ConfigError(Exception):
     pass
 
 
-# Default values for LLM parameters (used to detect non-default settings)
-LLM_PARAM_DEFAULTS = {
+# Distinguishes "key absent" from an explicit null in dict.get lookups
+_MISSING = object()
+
+
+# Default values for LLM parameters (used to detect non-default settings);
+# read-only so the tables derived from it below can't drift
+LLM_PARAM_DEFAULTS = MappingProxyType({
     "temperature": 1.0,
     "top_p": 1.0,
     "top_k": 0,
@@ -28,13 +34,35 @@ LLM_PARAM_DEFAULTS = {
     "top_a": 0.0,
     "seed": None,
     "max_tokens": None,
-}
+})
+
+# Sampling parameters that count as non-default only when they differ from the
+# default above, and parameters that count whenever they are set at all
+_PARAM_SPECS = tuple(
+    (name, LLM_PARAM_DEFAULTS[name])
+    for name in (
+        "temperature", "top_p", "top_k", "frequency_penalty",
+        "presence_penalty", "repetition_penalty", "min_p", "top_a",
+    )
+)
+_UNCONDITIONAL_PARAMS = ("seed", "max_tokens")
+
+# Every LLM parameter, in the order they appear in requests and params.json
+_ALL_PARAM_NAMES = tuple(name for name, _ in _PARAM_SPECS) + _UNCONDITIONAL_PARAMS
 
 # Valid reasoning effort levels
-VALID_REASONING_EFFORTS = {"low", "medium", "high"}
+VALID_REASONING_EFFORTS = frozenset({"low", "medium", "high"})
+_SORTED_REASONING_EFFORTS = sorted(VALID_REASONING_EFFORTS)
+
+# A non-empty provider and model name separated by exactly one slash
+_MODEL_ID_RE = re.compile(r"[^/]+/[^/]+")
 
+# Encoders accepted for animation.codec ("auto" picks a hardware one if present)
+VALID_ANIMATION_CODECS = frozenset({"libx264", "h264_nvenc", "h264_qsv", "auto"})
+_SORTED_ANIMATION_CODECS = sorted(VALID_ANIMATION_CODECS)
 
-@dataclass
+
+@dataclass(slots=True)
 class ReasoningConfig:
     """Configuration for reasoning/thinking tokens.
     
@@ -57,29 +85,30 @@ class ReasoningConfig:
             Dictionary suitable for the 'reasoning' parameter in API requests,
             or None if reasoning is not configured.
         """
-        if not self.is_enabled() and not self.exclude:
-            return None
-        
-        result = {}
-        
         # If just enabled with no specific settings, use medium effort as default
-        if self.enabled and self.effort is None and self.max_tokens is None:
-            result["effort"] = "medium"
-        elif self.effort is not None:
-            result["effort"] = self.effort
-        
-        if self.max_tokens is not None:
-            result["max_tokens"] = self.max_tokens
-        if self.exclude:
-            result["exclude"] = True
+        effort = self.effort
+        if effort is None and self.enabled and self.max_tokens is None:
+            effort = "medium"
         
-        return result if result else None
+        result = {
+            key: value
+            for key, value in (
+                ("effort", effort),
+                ("max_tokens", self.max_tokens),
+                ("exclude", True if self.exclude else None),
+            )
+            if value is not None
+        }
+        return result or None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiConfig:
     """API configuration settings including LLM parameters."""
     timeout: int = 600
+    max_concurrent: Optional[int] = None  # Cap on simultaneous requests (None = one per model)
+    cache_responses: bool = False  # Reuse responses to identical deterministic requests
+    use_streaming: bool = True  # Stream responses (False = one plain request per model)
     
     # LLM Parameters (all optional - None means use model defaults)
     temperature: Optional[float] = None
@@ -96,64 +125,63 @@ class ApiConfig:
     # Reasoning settings
     reasoning: Optional[ReasoningConfig] = None
     
+    # Parameter dicts are built on first use and handed out as read-only views;
+    # they're requested for every API call and output directory but only
+    # change while the config is loaded
+    _cached_all: Optional[Mapping] = field(default=None, init=False, repr=False, compare=False)
+    _cached_non_default: Optional[Mapping] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # Assigning a setting invalidates the cached parameter dicts. Mutating
+        # the nested ReasoningConfig in place is not tracked.
+        if not name.startswith("_cached"):
+            object.__setattr__(self, "_cached_all", None)
+            object.__setattr__(self, "_cached_non_default", None)
+    
     def has_non_default_params(self) -> bool:
         """Check if any LLM parameters are set to non-default values.
         
         Returns:
             True if any parameter differs from the default, False otherwise.
         """
-        if self.temperature is not None and self.temperature != LLM_PARAM_DEFAULTS["temperature"]:
-            return True
-        if self.top_p is not None and self.top_p != LLM_PARAM_DEFAULTS["top_p"]:
-            return True
-        if self.top_k is not None and self.top_k != LLM_PARAM_DEFAULTS["top_k"]:
-            return True
-        if self.frequency_penalty is not None and self.frequency_penalty != LLM_PARAM_DEFAULTS["frequency_penalty"]:
-            return True
-        if self.presence_penalty is not None and self.presence_penalty != LLM_PARAM_DEFAULTS["presence_penalty"]:
-            return True
-        if self.repetition_penalty is not None and self.repetition_penalty != LLM_PARAM_DEFAULTS["repetition_penalty"]:
-            return True
-        if self.min_p is not None and self.min_p != LLM_PARAM_DEFAULTS["min_p"]:
-            return True
-        if self.top_a is not None and self.top_a != LLM_PARAM_DEFAULTS["top_a"]:
-            return True
-        if self.seed is not None:
-            return True
-        if self.max_tokens is not None:
-            return True
-        # Check reasoning settings
-        if self.reasoning is not None and self.reasoning.is_enabled():
-            return True
-        return False
+        # Reuse the non-default dict if it has already been built; otherwise
+        # stop at the first non-default value rather than building it
+        if self._cached_non_default is not None:
+            return bool(self._cached_non_default)
+        return (
+            next(self._iter_non_defaults(), None) is not None
+            # Check reasoning settings
+            or (self.reasoning is not None and self.reasoning.is_enabled())
+        )
     
-    def get_non_default_params(self) -> dict:
-        """Get a dictionary of parameters that differ from defaults.
+    def _iter_non_defaults(self) -> Iterator[tuple[str, Union[int, float]]]:
+        """Yield (name, value) for each LLM parameter that differs from its default."""
+        for name, default in _PARAM_SPECS:
+            value = getattr(self, name)
+            if value is not None and value != default:
+                yield name, value
+        for name in _UNCONDITIONAL_PARAMS:
+            value = getattr(self, name)
+            if value is not None:
+                yield name, value
+    
+    def get_non_default_params(self) -> Mapping:
+        """Get the parameters that differ from defaults.
+        
+        The mapping is a read-only view shared between calls; use dict()
+        on it to get a copy that can be modified or serialized.
         
         Returns:
-            Dictionary mapping parameter names to their non-default values.
+            Mapping of parameter names to their non-default values.
         """
-        params = {}
-        if self.temperature is not None and self.temperature != LLM_PARAM_DEFAULTS["temperature"]:
-            params["temperature"] = self.temperature
-        if self.top_p is not None and self.top_p != LLM_PARAM_DEFAULTS["top_p"]:
-            params["top_p"] = self.top_p
-        if self.top_k is not None and self.top_k != LLM_PARAM_DEFAULTS["top_k"]:
-            params["top_k"] = self.top_k
-        if self.frequency_penalty is not None and self.frequency_penalty != LLM_PARAM_DEFAULTS["frequency_penalty"]:
-            params["frequency_penalty"] = self.frequency_penalty
-        if self.presence_penalty is not None and self.presence_penalty != LLM_PARAM_DEFAULTS["presence_penalty"]:
-            params["presence_penalty"] = self.presence_penalty
-        if self.repetition_penalty is not None and self.repetition_penalty != LLM_PARAM_DEFAULTS["repetition_penalty"]:
-            params["repetition_penalty"] = self.repetition_penalty
-        if self.min_p is not None and self.min_p != LLM_PARAM_DEFAULTS["min_p"]:
-            params["min_p"] = self.min_p
-        if self.top_a is not None and self.top_a != LLM_PARAM_DEFAULTS["top_a"]:
-            params["top_a"] = self.top_a
-        if self.seed is not None:
-            params["seed"] = self.seed
-        if self.max_tokens is not None:
-            params["max_tokens"] = self.max_tokens
+        if self._cached_non_default is None:
+            self._cached_non_default = MappingProxyType(self._build_non_default_params())
+        return self._cached_non_default
+    
+    def _build_non_default_params(self) -> dict:
+        """Build the dictionary returned by get_non_default_params."""
+        params = dict(self._iter_non_defaults())
         # Include reasoning if enabled
         if self.reasoning is not None and self.reasoning.is_enabled():
             reasoning_dict = self.reasoning.to_api_dict()
@@ -161,33 +189,26 @@ class ApiConfig:
                 params["reasoning"] = reasoning_dict
         return params
     
-    def get_all_params(self) -> dict:
-        """Get a dictionary of all set LLM parameters (non-None values).
+    def get_all_params(self) -> Mapping:
+        """Get all set LLM parameters (non-None values).
+        
+        The mapping is a read-only view shared between calls; use dict()
+        on it to get a copy that can be modified or serialized.
         
         Returns:
-            Dictionary mapping parameter names to their values.
+            Mapping of parameter names to their values.
         """
-        params = {}
-        if self.temperature is not None:
-            params["temperature"] = self.temperature
-        if self.top_p is not None:
-            params["top_p"] = self.top_p
-        if self.top_k is not None:
-            params["top_k"] = self.top_k
-        if self.frequency_penalty is not None:
-            params["frequency_penalty"] = self.frequency_penalty
-        if self.presence_penalty is not None:
-            params["presence_penalty"] = self.presence_penalty
-        if self.repetition_penalty is not None:
-            params["repetition_penalty"] = self.repetition_penalty
-        if self.min_p is not None:
-            params["min_p"] = self.min_p
-        if self.top_a is not None:
-            params["top_a"] = self.top_a
-        if self.seed is not None:
-            params["seed"] = self.seed
-        if self.max_tokens is not None:
-            params["max_tokens"] = self.max_tokens
+        if self._cached_all is None:
+            self._cached_all = MappingProxyType(self._build_all_params())
+        return self._cached_all
+    
+    def _build_all_params(self) -> dict:
+        """Build the dictionary returned by get_all_params."""
+        params = {
+            name: value
+            for name in _ALL_PARAM_NAMES
+            if (value := getattr(self, name)) is not None
+        }
         # Include reasoning if configured
         if self.reasoning is not None:
             reasoning_dict = self.reasoning.to_api_dict()
@@ -196,51 +217,52 @@ class ApiConfig:
         return params
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimationConfig:
     """Configuration for generating animations."""
     enabled: bool = False
     duration: float = 3.0  # seconds for full rotation
     fps: int = 24
     resolution: tuple[int, int] = (800, 600)
+    render_scale: float = 1.0  # fraction of resolution rendered before upscaling
+    symmetric: bool = False  # render half the orbit and loop it (180°-symmetric meshes)
+    codec: str = "libx264"  # H.264 encoder: libx264, h264_nvenc, h264_qsv or auto
     ffmpeg_path: Optional[str] = None  # None means use system PATH
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration for OpenSCAD benchmark automation."""
     models: list[str]
-    challenges: Union[str, list[str]] = "all"
-    exclude_challenges: list[str] = field(default_factory=list)
+    challenges: Union[str, tuple[str, ...]] = "all"
+    exclude_challenges: frozenset[str] = field(default_factory=frozenset)
     openscad_path: str = "openscad"
+    render_processes: bool = False  # Render in recycled worker processes, not asyncio
     api: ApiConfig = field(default_factory=ApiConfig)
     animation: Optional[AnimationConfig] = None
     
-    # Loaded at runtime
-    _system_prompt: str = field(default="", repr=False)
-    _api_key: Optional[str] = field(default=None, repr=False)
-    _project_root: Optional[Path] = field(default=None, repr=False)
+    # Loaded at runtime; checked once by validated()
+    system_prompt: str = field(default="", repr=False)
+    api_key: Optional[str] = field(default=None, repr=False)
+    project_root: Optional[Path] = field(default=None, repr=False)
+    _resolved_openscad: Optional[str] = field(default=None, repr=False, compare=False)
     
-    @property
-    def system_prompt(self) -> str:
-        """Get the system prompt content."""
-        if not self._system_prompt:
+    def validated(self) -> "Config":
+        """Check that the runtime fields have been loaded.
+        
+        Returns:
+            This config, so the call can be chained.
+            
+        Raises:
+            ConfigError: If the system prompt, API key or project root is missing.
+        """
+        if not self.system_prompt:
             raise ConfigError("System prompt not configured.")
-        return self._system_prompt
-    
-    @property
-    def api_key(self) -> str:
-        """Get the API key from environment."""
-        if self._api_key is None:
+        if self.api_key is None:
             raise ConfigError("API key not loaded. Call load_api_key() first.")
-        return self._api_key
-    
-    @property
-    def project_root(self) -> Path:
-        """Get the project root directory."""
-        if self._project_root is None:
+        if self.project_root is None:
             raise ConfigError("Project root not set.")
-        return self._project_root
+        return self
 
 
 def _validate_model_id(model_id: str) -> None:
@@ -248,6 +270,10 @@ def _validate_model_id(model_id: str) -> None:
     if not isinstance(model_id, str):
         raise ConfigError(f"Model ID must be a string, got {type(model_id).__name__}")
     
+    # Common case: one C-level match, no substrings built
+    if _MODEL_ID_RE.fullmatch(model_id):
+        return
+    
     # Must contain exactly one slash
     if model_id.count('/') != 1:
         raise ConfigError(
@@ -255,12 +281,10 @@ def _validate_model_id(model_id: str) -> None:
             "Expected format: {{provider}}/{{model-name}}"
         )
     
-    provider, model_name = model_id.split('/')
-    if not provider or not model_name:
-        raise ConfigError(
-            f"Invalid model ID format: '{model_id}'. "
-            "Both provider and model name must be non-empty."
-        )
+    raise ConfigError(
+        f"Invalid model ID format: '{model_id}'. "
+        "Both provider and model name must be non-empty."
+    )
 
 
 def _validate_challenges(challenges: Union[str, list]) -> None:
@@ -274,13 +298,14 @@ def _validate_challenges(challenges: Union[str, list]) -> None:
     elif isinstance(challenges, list):
         if not challenges:
             raise ConfigError("Challenges list cannot be empty.")
-        for challenge in challenges:
-            if not isinstance(challenge, str):
+        # Find the first bad name in one short-circuiting pass
+        bad = next((c for c in challenges if not isinstance(c, str) or not c), _MISSING)
+        if bad is not _MISSING:
+            if not isinstance(bad, str):
                 raise ConfigError(
-                    f"Challenge name must be a string, got {type(challenge).__name__}"
+                    f"Challenge name must be a string, got {type(bad).__name__}"
                 )
-            if not challenge:
-                raise ConfigError("Challenge name cannot be empty.")
+            raise ConfigError("Challenge name cannot be empty.")
     else:
         raise ConfigError(
             f"Challenges must be 'all' or a list of strings, got {type(challenges).__name__}"
@@ -293,153 +318,164 @@ def _validate_exclude_challenges(exclude_challenges: list) -> None:
         raise ConfigError(
             f"'exclude_challenges' must be a list of strings, got {type(exclude_challenges).__name__}"
         )
-    for challenge in exclude_challenges:
-        if not isinstance(challenge, str):
+    bad = next((c for c in exclude_challenges if not isinstance(c, str) or not c), _MISSING)
+    if bad is not _MISSING:
+        if not isinstance(bad, str):
             raise ConfigError(
-                f"Exclude challenge name must be a string, got {type(challenge).__name__}"
+                f"Exclude challenge name must be a string, got {type(bad).__name__}"
             )
-        if not challenge:
-            raise ConfigError("Exclude challenge name cannot be empty.")
+        raise ConfigError("Exclude challenge name cannot be empty.")
+
+
+# Numeric LLM parameters: (name, type, minimum, maximum). Bounds are inclusive
+# and None means unbounded; floats accept ints and are stored as float.
+_API_NUMBER_SPECS = (
+    ("temperature", float, 0.0, 2.0),
+    ("top_p", float, 0.0, 1.0),
+    ("top_k", int, 0, None),
+    ("frequency_penalty", float, -2.0, 2.0),
+    ("presence_penalty", float, -2.0, 2.0),
+    ("repetition_penalty", float, 0.0, 2.0),
+    ("min_p", float, 0.0, 1.0),
+    ("top_a", float, 0.0, 1.0),
+    ("seed", int, None, None),
+    ("max_tokens", int, 1, None),
+)
+
+
+def _check_number(name: str, value, kind: type, low, high) -> Union[int, float]:
+    """Validate a numeric setting against its type and inclusive bounds.
+    
+    Args:
+        name: Setting name used in error messages.
+        value: The raw value from the config file.
+        kind: ``float`` (ints accepted and converted) or ``int``.
+        low: Minimum allowed value, or None.
+        high: Maximum allowed value, or None.
+        
+    Returns:
+        The value, converted to float for float settings.
+        
+    Raises:
+        ConfigError: If the value has the wrong type or is out of range.
+    """
+    if kind is float:
+        if not isinstance(value, (int, float)):
+            raise ConfigError(f"{name} must be a number, got {type(value).__name__}")
+    elif not isinstance(value, int):
+        raise ConfigError(f"{name} must be an integer, got {type(value).__name__}")
+    
+    if high is not None:
+        if value < low or value > high:
+            raise ConfigError(f"{name} must be between {low} and {high}, got {value}")
+    elif low is not None and value < low:
+        bound = "0 or above" if low == 0 else f"at least {low}"
+        raise ConfigError(f"{name} must be {bound}, got {value}")
+    
+    return float(value) if kind is float else value
+
+
+# Animation settings: (name, check, convert, error message). The table is
+# built once at import and applied in order by load_config.
+_ANIMATION_SPECS = (
+    ("enabled", lambda v: isinstance(v, bool), bool,
+     "animation.enabled must be a boolean."),
+    ("duration", lambda v: isinstance(v, (int, float)) and v > 0, float,
+     "animation.duration must be a positive number."),
+    ("fps", lambda v: isinstance(v, int) and v > 0, int,
+     "animation.fps must be a positive integer."),
+    ("resolution",
+     lambda v: isinstance(v, (list, tuple)) and len(v) == 2
+     and all(isinstance(x, int) and x > 0 for x in v),
+     tuple, "animation.resolution must be a tuple of 2 positive integers."),
+    ("render_scale",
+     lambda v: not isinstance(v, bool) and isinstance(v, (int, float)) and 0 < v <= 1,
+     float, "animation.render_scale must be a number in (0, 1]."),
+    ("symmetric", lambda v: isinstance(v, bool), bool,
+     "animation.symmetric must be a boolean."),
+    ("codec", lambda v: isinstance(v, str) and v in VALID_ANIMATION_CODECS, str,
+     "animation.codec must be one of %s, got '{value}'" % _SORTED_ANIMATION_CODECS),
+    ("ffmpeg_path", lambda v: v is None or isinstance(v, str), lambda v: v,
+     "animation.ffmpeg_path must be a string or null."),
+)
 
 
 def _validate_api_config(api_dict: dict) -> ApiConfig:
     """Validate and create ApiConfig from dictionary."""
     api_config = ApiConfig()
     
-    if "timeout" in api_dict:
-        timeout = api_dict["timeout"]
+    timeout = api_dict.get("timeout", _MISSING)
+    if timeout is not _MISSING:
         if not isinstance(timeout, int) or timeout <= 0:
             raise ConfigError(f"API timeout must be a positive integer, got {timeout}")
         api_config.timeout = timeout
     
-    # Validate LLM parameters
+    max_concurrent = api_dict.get("max_concurrent")
+    if max_concurrent is not None:
+        if isinstance(max_concurrent, bool) or not isinstance(max_concurrent, int) or max_concurrent <= 0:
+            raise ConfigError(
+                f"API max_concurrent must be a positive integer or null, got {max_concurrent}"
+            )
+        api_config.max_concurrent = max_concurrent
+    
+    cache_responses = api_dict.get("cache_responses")
+    if cache_responses is not None:
+        if not isinstance(cache_responses, bool):
+            raise ConfigError(
+                f"API cache_responses must be a boolean, got {type(cache_responses).__name__}"
+            )
+        api_config.cache_responses = cache_responses
     
-    # Temperature: 0.0 to 2.0
-    if "temperature" in api_dict and api_dict["temperature"] is not None:
-        temp = api_dict["temperature"]
-        if not isinstance(temp, (int, float)):
-            raise ConfigError(f"temperature must be a number, got {type(temp).__name__}")
-        if temp < 0.0 or temp > 2.0:
-            raise ConfigError(f"temperature must be between 0.0 and 2.0, got {temp}")
-        api_config.temperature = float(temp)
-    
-    # Top P: 0.0 to 1.0
-    if "top_p" in api_dict and api_dict["top_p"] is not None:
-        top_p = api_dict["top_p"]
-        if not isinstance(top_p, (int, float)):
-            raise ConfigError(f"top_p must be a number, got {type(top_p).__name__}")
-        if top_p < 0.0 or top_p > 1.0:
-            raise ConfigError(f"top_p must be between 0.0 and 1.0, got {top_p}")
-        api_config.top_p = float(top_p)
-    
-    # Top K: 0 or above (integer)
-    if "top_k" in api_dict and api_dict["top_k"] is not None:
-        top_k = api_dict["top_k"]
-        if not isinstance(top_k, int):
-            raise ConfigError(f"top_k must be an integer, got {type(top_k).__name__}")
-        if top_k < 0:
-            raise ConfigError(f"top_k must be 0 or above, got {top_k}")
-        api_config.top_k = top_k
-    
-    # Frequency Penalty: -2.0 to 2.0
-    if "frequency_penalty" in api_dict and api_dict["frequency_penalty"] is not None:
-        freq = api_dict["frequency_penalty"]
-        if not isinstance(freq, (int, float)):
-            raise ConfigError(f"frequency_penalty must be a number, got {type(freq).__name__}")
-        if freq < -2.0 or freq > 2.0:
-            raise ConfigError(f"frequency_penalty must be between -2.0 and 2.0, got {freq}")
-        api_config.frequency_penalty = float(freq)
-    
-    # Presence Penalty: -2.0 to 2.0
-    if "presence_penalty" in api_dict and api_dict["presence_penalty"] is not None:
-        pres = api_dict["presence_penalty"]
-        if not isinstance(pres, (int, float)):
-            raise ConfigError(f"presence_penalty must be a number, got {type(pres).__name__}")
-        if pres < -2.0 or pres > 2.0:
-            raise ConfigError(f"presence_penalty must be between -2.0 and 2.0, got {pres}")
-        api_config.presence_penalty = float(pres)
-    
-    # Repetition Penalty: 0.0 to 2.0
-    if "repetition_penalty" in api_dict and api_dict["repetition_penalty"] is not None:
-        rep = api_dict["repetition_penalty"]
-        if not isinstance(rep, (int, float)):
-            raise ConfigError(f"repetition_penalty must be a number, got {type(rep).__name__}")
-        if rep < 0.0 or rep > 2.0:
-            raise ConfigError(f"repetition_penalty must be between 0.0 and 2.0, got {rep}")
-        api_config.repetition_penalty = float(rep)
-    
-    # Min P: 0.0 to 1.0
-    if "min_p" in api_dict and api_dict["min_p"] is not None:
-        min_p = api_dict["min_p"]
-        if not isinstance(min_p, (int, float)):
-            raise ConfigError(f"min_p must be a number, got {type(min_p).__name__}")
-        if min_p < 0.0 or min_p > 1.0:
-            raise ConfigError(f"min_p must be between 0.0 and 1.0, got {min_p}")
-        api_config.min_p = float(min_p)
-    
-    # Top A: 0.0 to 1.0
-    if "top_a" in api_dict and api_dict["top_a"] is not None:
-        top_a = api_dict["top_a"]
-        if not isinstance(top_a, (int, float)):
-            raise ConfigError(f"top_a must be a number, got {type(top_a).__name__}")
-        if top_a < 0.0 or top_a > 1.0:
-            raise ConfigError(f"top_a must be between 0.0 and 1.0, got {top_a}")
-        api_config.top_a = float(top_a)
-    
-    # Seed: integer (optional)
-    if "seed" in api_dict and api_dict["seed"] is not None:
-        seed = api_dict["seed"]
-        if not isinstance(seed, int):
-            raise ConfigError(f"seed must be an integer, got {type(seed).__name__}")
-        api_config.seed = seed
-    
-    # Max Tokens: positive integer (optional)
-    if "max_tokens" in api_dict and api_dict["max_tokens"] is not None:
-        max_tokens = api_dict["max_tokens"]
-        if not isinstance(max_tokens, int):
-            raise ConfigError(f"max_tokens must be an integer, got {type(max_tokens).__name__}")
-        if max_tokens < 1:
-            raise ConfigError(f"max_tokens must be at least 1, got {max_tokens}")
-        api_config.max_tokens = max_tokens
+    use_streaming = api_dict.get("use_streaming")
+    if use_streaming is not None:
+        if not isinstance(use_streaming, bool):
+            raise ConfigError(
+                f"API use_streaming must be a boolean, got {type(use_streaming).__name__}"
+            )
+        api_config.use_streaming = use_streaming
+    
+    # Validate LLM parameters
+    for name, kind, low, high in _API_NUMBER_SPECS:
+        value = api_dict.get(name)
+        if value is not None:
+            setattr(api_config, name, _check_number(name, value, kind, low, high))
     
     # Validate reasoning settings
-    if "reasoning" in api_dict and api_dict["reasoning"] is not None:
-        reasoning_dict = api_dict["reasoning"]
+    reasoning_dict = api_dict.get("reasoning")
+    if reasoning_dict is not None:
         if not isinstance(reasoning_dict, dict):
             raise ConfigError(f"reasoning must be a mapping (dictionary), got {type(reasoning_dict).__name__}")
         
         reasoning_config = ReasoningConfig()
         
         # Enabled: boolean (enable reasoning with default settings)
-        if "enabled" in reasoning_dict and reasoning_dict["enabled"] is not None:
-            enabled = reasoning_dict["enabled"]
+        enabled = reasoning_dict.get("enabled")
+        if enabled is not None:
             if not isinstance(enabled, bool):
                 raise ConfigError(f"reasoning.enabled must be a boolean, got {type(enabled).__name__}")
             reasoning_config.enabled = enabled
         
         # Effort: "low", "medium", or "high"
-        if "effort" in reasoning_dict and reasoning_dict["effort"] is not None:
-            effort = reasoning_dict["effort"]
+        effort = reasoning_dict.get("effort")
+        if effort is not None:
             if not isinstance(effort, str):
                 raise ConfigError(f"reasoning.effort must be a string, got {type(effort).__name__}")
             if effort not in VALID_REASONING_EFFORTS:
                 raise ConfigError(
-                    f"reasoning.effort must be one of {sorted(VALID_REASONING_EFFORTS)}, got '{effort}'"
+                    f"reasoning.effort must be one of {_SORTED_REASONING_EFFORTS}, got '{effort}'"
                 )
             reasoning_config.effort = effort
         
         # Max Tokens for reasoning: positive integer
-        if "max_tokens" in reasoning_dict and reasoning_dict["max_tokens"] is not None:
-            r_max_tokens = reasoning_dict["max_tokens"]
-            if not isinstance(r_max_tokens, int):
-                raise ConfigError(f"reasoning.max_tokens must be an integer, got {type(r_max_tokens).__name__}")
-            if r_max_tokens < 1:
-                raise ConfigError(f"reasoning.max_tokens must be at least 1, got {r_max_tokens}")
-            reasoning_config.max_tokens = r_max_tokens
+        max_tokens = reasoning_dict.get("max_tokens")
+        if max_tokens is not None:
+            reasoning_config.max_tokens = _check_number(
+                "reasoning.max_tokens", max_tokens, int, 1, None
+            )
         
         # Exclude: boolean
-        if "exclude" in reasoning_dict and reasoning_dict["exclude"] is not None:
-            exclude = reasoning_dict["exclude"]
+        exclude = reasoning_dict.get("exclude")
+        if exclude is not None:
             if not isinstance(exclude, bool):
                 raise ConfigError(f"reasoning.exclude must be a boolean, got {type(exclude).__name__}")
             reasoning_config.exclude = exclude
@@ -468,17 +504,23 @@ def load_config(config_path: Union[str, Path]) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        raw_config = yaml.safe_load(f)
+    import yaml
+    
+    # Prefer libyaml's C parser when PyYAML was built with it; same safe semantics
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    
+    # Read the file in one go and let the loader decode it (UTF-8, or UTF-16
+    # with a BOM) rather than streaming it through a text-mode wrapper
+    raw_config = yaml.load(config_path.read_bytes(), Loader=loader)
     
     if not isinstance(raw_config, dict):
         raise ConfigError("Configuration file must contain a YAML mapping (dictionary).")
     
     # Validate required fields
-    if "models" not in raw_config:
+    models = raw_config.get("models", _MISSING)
+    if models is _MISSING:
         raise ConfigError("Configuration must include 'models' field.")
     
-    models = raw_config["models"]
     if not isinstance(models, list) or not models:
         raise ConfigError("'models' must be a non-empty list of model IDs.")
     
@@ -495,6 +537,12 @@ def load_config(config_path: Union[str, Path]) -> Config:
         exclude_challenges = []
     _validate_exclude_challenges(exclude_challenges)
     
+    # Store the lists immutably: the requested challenges keep their order,
+    # exclusions only need O(1) membership tests
+    if isinstance(challenges, list):
+        challenges = tuple(challenges)
+    exclude_challenges = frozenset(exclude_challenges)
+    
     # Validate API config
     api_dict = raw_config.get("api", {})
     if not isinstance(api_dict, dict):
@@ -503,46 +551,43 @@ def load_config(config_path: Union[str, Path]) -> Config:
     
     # Validate animation config
     animation_config = None
-    if "animation" in raw_config:
-        anim_dict = raw_config["animation"]
+    anim_dict = raw_config.get("animation", _MISSING)
+    if anim_dict is not _MISSING:
         if not isinstance(anim_dict, dict):
             raise ConfigError("'animation' must be a mapping (dictionary).")
         
         animation_config = AnimationConfig()
-        
-        if "enabled" in anim_dict:
-            if not isinstance(anim_dict["enabled"], bool):
-                raise ConfigError("animation.enabled must be a boolean.")
-            animation_config.enabled = anim_dict["enabled"]
-            
-        if "duration" in anim_dict:
-            val = anim_dict["duration"]
-            if not isinstance(val, (int, float)) or val <= 0:
-                raise ConfigError("animation.duration must be a positive number.")
-            animation_config.duration = float(val)
-            
-        if "fps" in anim_dict:
-            val = anim_dict["fps"]
-            if not isinstance(val, int) or val <= 0:
-                raise ConfigError("animation.fps must be a positive integer.")
-            animation_config.fps = val
-            
-        if "resolution" in anim_dict:
-            val = anim_dict["resolution"]
-            if not isinstance(val, (list, tuple)) or len(val) != 2 or not all(isinstance(x, int) and x > 0 for x in val):
-                raise ConfigError("animation.resolution must be a tuple of 2 positive integers.")
-            animation_config.resolution = tuple(val)
-            
-        if "ffmpeg_path" in anim_dict:
-            val = anim_dict["ffmpeg_path"]
-            if val is not None and not isinstance(val, str):
-                raise ConfigError("animation.ffmpeg_path must be a string or null.")
-            animation_config.ffmpeg_path = val
-
-    # Validate system prompt
+        for name, check, convert, message in _ANIMATION_SPECS:
+            val = anim_dict.get(name, _MISSING)
+            if val is not _MISSING:
+                if not check(val):
+                    raise ConfigError(message.format(value=val))
+                setattr(animation_config, name, convert(val))
+
+    # Validate system prompt (inline, or read from a file next to the config)
     system_prompt = raw_config.get("system_prompt", "")
+    prompt_file = raw_config.get("system_prompt_file")
+    if prompt_file is not None:
+        if system_prompt:
+            raise ConfigError("Set only one of 'system_prompt' and 'system_prompt_file'.")
+        if not isinstance(prompt_file, str) or not prompt_file:
+            raise ConfigError("'system_prompt_file' must be a non-empty path string.")
+        prompt_path = project_root / prompt_file
+        try:
+            system_prompt = prompt_path.read_text(encoding="utf-8")
+        except OSError as e:
+            raise ConfigError(f"Could not read system prompt file {prompt_path}: {e}") from e
     if not system_prompt or not isinstance(system_prompt, str):
-        raise ConfigError("Configuration must include a non-empty 'system_prompt' field.")
+        raise ConfigError(
+            "Configuration must include a non-empty 'system_prompt' field "
+            "(or a 'system_prompt_file' to read it from)."
+        )
+    
+    render_processes = raw_config.get("render_processes", False)
+    if not isinstance(render_processes, bool):
+        raise ConfigError(
+            f"render_processes must be a boolean, got {type(render_processes).__name__}"
+        )
     
     # Create config object
     config = Config(
@@ -550,11 +595,12 @@ def load_config(config_path: Union[str, Path]) -> Config:
         challenges=challenges,
         exclude_challenges=exclude_challenges,
         openscad_path=raw_config.get("openscad_path", "openscad"),
+        render_processes=render_processes,
         api=api_config,
         animation=animation_config,
     )
-    config._project_root = project_root
-    config._system_prompt = system_prompt.strip()
+    config.project_root = project_root
+    config.system_prompt = system_prompt.strip()
     
     return config
 
@@ -568,8 +614,13 @@ def load_api_key(config: Config) -> None:
     Raises:
         ConfigError: If OPENROUTER_API_KEY environment variable is not set.
     """
-    load_dotenv()
+    # Only look for a .env file when the key isn't already in the environment
     api_key = os.environ.get("OPENROUTER_API_KEY")
+    if not api_key:
+        from dotenv import load_dotenv
+        
+        load_dotenv()
+        api_key = os.environ.get("OPENROUTER_API_KEY")
     
     if not api_key:
         raise ConfigError(
@@ -577,12 +628,15 @@ def load_api_key(config: Config) -> None:
             "Please set it to your OpenRouter API key."
         )
     
-    config._api_key = api_key
+    config.api_key = api_key
 
 
 def validate_openscad_path(config: Config) -> bool:
     """Check if the OpenSCAD executable exists.
     
+    On success ``config.openscad_path`` is replaced with the absolute path
+    of the executable and remembered, so repeat calls don't touch the disk.
+    
     Args:
         config: Configuration object with openscad_path set.
         
@@ -591,12 +645,22 @@ def validate_openscad_path(config: Config) -> bool:
     """
     openscad_path = config.openscad_path
     
+    # Already resolved by an earlier call (and openscad_path not changed since)
+    if config._resolved_openscad is not None and config._resolved_openscad == openscad_path:
+        return True
+    
     # Check if it's an absolute path that exists
     if Path(openscad_path).is_file():
-        return True
+        resolved = str(Path(openscad_path).resolve())
+    else:
+        # Check if it's in PATH
+        resolved = shutil.which(openscad_path)
+        if resolved is None:
+            return False
     
-    # Check if it's in PATH
-    return shutil.which(openscad_path) is not None
+    # Run the resolved executable from now on so PATH isn't searched per render
+    config.openscad_path = config._resolved_openscad = resolved
+    return True
 
 
 def validate_ffmpeg_path(config: Config) -> Optional[str]:
@@ -628,6 +692,7 @@ def get_config(config_path: Union[str, Path] = "config.yaml") -> Config:
     1. Loads and validates the YAML config (including system prompt)
     2. Loads the API key from environment
     3. Warns if OpenSCAD is not found
+    4. Checks that the runtime fields are set (see Config.validated)
     
     Args:
         config_path: Path to the configuration YAML file.
@@ -659,4 +724,4 @@ def get_config(config_path: Union[str, Path] = "config.yaml") -> Config:
                 UserWarning
             )
     
-    return config
\ No newline at end of file
+    return config.validated()
\ No newline at end of file
@@ -1,16 +1,106 @@
 """OpenRouter API client for sending prompts and extracting code responses."""
 
+import copy
+import hashlib
 import json
+import logging
 import re
-from typing import Callable, Generator, Optional, Union
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Generator, Iterable, Mapping, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     from config import ApiConfig
 except ImportError:
     from .config import ApiConfig
 
+logger = logging.getLogger(__name__)
+
+# orjson parses stream deltas several times faster when it's installed; both
+# accept UTF-8 bytes and raise ValueError subclasses on bad input
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# One pooled session for every request: concurrent model calls all go to the
+# same host, so they reuse keep-alive connections instead of each paying for
+# a new TCP + TLS handshake. Retries stay off, as with plain requests.post.
+# The pool grows through reserve_connections when more models run at once.
+_SESSION = requests.Session()
+_session_pool_size = 32
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=32, pool_maxsize=_session_pool_size, max_retries=0),
+)
+
+
+_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Headers sent with every request; only Authorization depends on the caller
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/openscad-bench",
+    "X-Title": "OpenSCAD Bench",
+}
+
+
+# (api_key, headers) for the most recent key passed to _get_headers
+_cached_headers: Optional[tuple[str, dict]] = None
+
+
+# Consumed bytes are dropped from the SSE line buffer once this many pile up
+_SSE_COMPACT_THRESHOLD = 32768
+
+
+# Responses to deterministic requests, keyed by a hash of the request payload
+# and kept in least-recently-used order
+_RESPONSE_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 64
+_response_cache_lock = threading.Lock()
+
+
+def close_session() -> None:
+    """Close the pooled connections held by the shared HTTP session.
+    
+    The session stays usable afterwards; new connections are opened on demand.
+    """
+    _SESSION.close()
+
+
+def reserve_connections(count: int) -> None:
+    """Let the shared HTTP session keep at least ``count`` connections alive.
+    
+    urllib3 discards connections beyond the pool size once a request
+    finishes, so every concurrent request needs a slot to keep reusing its
+    connection. Call this while no requests are in flight: replacing the
+    pool closes its idle connections.
+    
+    Args:
+        count: Number of requests that may run at the same time.
+    """
+    global _session_pool_size
+    if count <= _session_pool_size:
+        return
+    old_adapter = _SESSION.get_adapter(_API_URL)
+    _SESSION.mount(
+        "https://",
+        HTTPAdapter(pool_connections=32, pool_maxsize=count, max_retries=0),
+    )
+    old_adapter.close()
+    _session_pool_size = count
+
+
+def clear_response_cache() -> None:
+    """Drop every response held by the in-process response cache."""
+    with _response_cache_lock:
+        _RESPONSE_CACHE.clear()
+
 
 class OpenRouterError(Exception):
     """Base exception for OpenRouter API errors."""
@@ -67,33 +157,8 @@ def _build_payload(
         ],
     }
     
-    # Add LLM parameters if configured
-    if api_config.temperature is not None:
-        payload["temperature"] = api_config.temperature
-    if api_config.top_p is not None:
-        payload["top_p"] = api_config.top_p
-    if api_config.top_k is not None:
-        payload["top_k"] = api_config.top_k
-    if api_config.frequency_penalty is not None:
-        payload["frequency_penalty"] = api_config.frequency_penalty
-    if api_config.presence_penalty is not None:
-        payload["presence_penalty"] = api_config.presence_penalty
-    if api_config.repetition_penalty is not None:
-        payload["repetition_penalty"] = api_config.repetition_penalty
-    if api_config.min_p is not None:
-        payload["min_p"] = api_config.min_p
-    if api_config.top_a is not None:
-        payload["top_a"] = api_config.top_a
-    if api_config.seed is not None:
-        payload["seed"] = api_config.seed
-    if api_config.max_tokens is not None:
-        payload["max_tokens"] = api_config.max_tokens
-    
-    # Add reasoning settings if configured
-    if api_config.reasoning is not None:
-        reasoning_dict = api_config.reasoning.to_api_dict()
-        if reasoning_dict:
-            payload["reasoning"] = reasoning_dict
+    # LLM parameters and reasoning settings, built once per config and cached
+    payload.update(api_config.get_all_params())
     
     return payload
 
@@ -101,18 +166,107 @@ def _build_payload(
 def _get_headers(api_key: str) -> dict:
     """Get the standard headers for API requests.
     
+    The API key rarely changes during a run, so the headers dict for the
+    last key is built once and reused. Callers must not modify it.
+    
     Args:
         api_key: OpenRouter API key.
         
     Returns:
         Headers dictionary.
     """
-    return {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": "https://github.com/openscad-bench",
-        "X-Title": "OpenSCAD Bench",
-    }
+    global _cached_headers
+    cached = _cached_headers
+    if cached is None or cached[0] != api_key:
+        cached = _cached_headers = (
+            api_key,
+            {"Authorization": f"Bearer {api_key}", **_BASE_HEADERS},
+        )
+    return cached[1]
+
+
+def _response_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: Union[str, list],
+    api_config: ApiConfig,
+) -> Optional[str]:
+    """Get the response cache key for a request.
+    
+    Only requests expected to give the same answer every time are cached:
+    a seed must be set and the temperature explicitly set to 0. An unset
+    temperature is not enough, since providers then sample at their default
+    of 1.0.
+    
+    The key covers everything _build_payload puts in the request. The parts
+    are fed to the hash directly rather than serialized to JSON first, since
+    the user prompt can carry a base64 reference image of several MB.
+    
+    Args:
+        model: The model ID.
+        system_prompt: The system prompt.
+        user_prompt: The user prompt, a string or a list of content parts.
+        api_config: API configuration settings.
+        
+    Returns:
+        A hex digest identifying the request, or None if it shouldn't be cached.
+    """
+    if not api_config.cache_responses or api_config.seed is None:
+        return None
+    if api_config.temperature != 0:
+        return None
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in (model, system_prompt, user_prompt, api_config.get_all_params()):
+        _hash_value(hasher, part)
+    return hasher.hexdigest()
+
+
+def _hash_value(hasher, value) -> None:
+    """Feed a JSON-like value into a hash.
+    
+    Every item is tagged with its type and length, so different structures
+    can't produce the same byte stream.
+    """
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+        hasher.update(b"s%d:" % len(data))
+        hasher.update(data)
+    elif isinstance(value, Mapping):
+        hasher.update(b"d%d:" % len(value))
+        for key in sorted(value):
+            _hash_value(hasher, key)
+            _hash_value(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"l%d:" % len(value))
+        for item in value:
+            _hash_value(hasher, item)
+    else:
+        # Numbers, booleans and None
+        _hash_value(hasher, repr(value))
+
+
+def _get_cached_response(key: Optional[str]) -> Optional[dict]:
+    """Look up a cached response, returning a copy the caller may modify."""
+    if key is None:
+        return None
+    with _response_cache_lock:
+        response = _RESPONSE_CACHE.get(key)
+        if response is None:
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+    return copy.deepcopy(response)
+
+
+def _store_cached_response(key: Optional[str], response: dict) -> None:
+    """Remember a response, evicting the least recently used one if full."""
+    if key is None:
+        return
+    response = copy.deepcopy(response)
+    with _response_cache_lock:
+        _RESPONSE_CACHE[key] = response
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
 
 
 def _handle_http_error(response: requests.Response, model: str) -> None:
@@ -184,6 +338,48 @@ def _check_response_error(data: dict, model: str) -> None:
         raise OpenRouterError(error_msg, model=model)
 
 
+def _iter_sse_line_batches(chunks: Iterable[bytes]) -> Generator[list[bytes], None, None]:
+    """Split a stream of raw byte chunks into batches of SSE lines.
+    
+    Each batch holds the lines completed by one chunk, so consumers can
+    handle a burst of deltas that arrived together in one go.
+    
+    Bytes accumulate in a bytearray that is read through a moving offset and
+    only compacted once a sizeable prefix has been consumed, so framing is
+    linear in the response size even when many short lines arrive in one
+    chunk. The newline search resumes where the last one stopped, so a long
+    line split over many chunks is not rescanned from its start. Lines are
+    split on "\n" only (str.splitlines would also break on characters like
+    U+2028 inside JSON strings) and left undecoded: the payloads are JSON,
+    which is parsed straight from UTF-8 bytes.
+    
+    Args:
+        chunks: Raw body chunks, e.g. from ``response.iter_content()``.
+        
+    Yields:
+        Non-empty lists of lines as bytes, without their trailing newlines
+        (a "\r" may remain).
+    """
+    buffer = bytearray()
+    pos = 0  # start of the current, unfinished line
+    scan_from = 0  # bytes before this are known to hold no newline
+    for chunk in chunks:
+        buffer += chunk
+        lines = []
+        while (line_end := buffer.find(b"\n", scan_from)) != -1:
+            lines.append(bytes(buffer[pos:line_end]))
+            pos = scan_from = line_end + 1
+        if lines:
+            yield lines
+        scan_from = len(buffer)
+        if pos == len(buffer) or pos > _SSE_COMPACT_THRESHOLD:
+            del buffer[:pos]
+            scan_from -= pos
+            pos = 0
+    if pos < len(buffer):
+        yield [bytes(buffer[pos:])]
+
+
 def send_prompt_streaming(
     model: str,
     system_prompt: str,
@@ -196,6 +392,8 @@ def send_prompt_streaming(
     """Send a streaming chat completion request to OpenRouter.
     
     Streams the response to stdout in real-time and accumulates the full response.
+    With api.cache_responses on, repeats of a deterministic request are
+    answered from the in-process response cache without calling the API.
     
     Args:
         model: The model ID (e.g., 'openai/gpt-4o').
@@ -216,16 +414,23 @@ def send_prompt_streaming(
         ContentFilterError: If content is filtered.
         OpenRouterError: For other API errors.
     """
-    import logging
-    logger = logging.getLogger(__name__)
+    payload = _build_payload(model, system_prompt, user_prompt, api_config)
+    
+    # Streaming and non-streaming calls share cache entries: both return the
+    # same response shape, so the key leaves out the stream flag
+    cache_key = _response_cache_key(model, system_prompt, user_prompt, api_config)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        logger.debug("Reusing cached response for %s", model)
+        return cached
     
-    url = "https://openrouter.ai/api/v1/chat/completions"
     headers = _get_headers(api_key)
-    payload = _build_payload(model, system_prompt, user_prompt, api_config)
     payload["stream"] = True
     
-    accumulated_content = ""
-    accumulated_reasoning = ""
+    # Deltas are collected and joined once at the end; repeated += on str
+    # is only linear while CPython can resize the string in place
+    content_parts: list[str] = []
+    reasoning_parts: list[str] = []
     response_id = None
     response_model = None
     finish_reason = None
@@ -233,8 +438,8 @@ def send_prompt_streaming(
     processing_logged = False
     
     try:
-        with requests.post(
-            url,
+        with _SESSION.post(
+            _API_URL,
             headers=headers,
             json=payload,
             timeout=api_config.timeout,
@@ -243,80 +448,81 @@ def send_prompt_streaming(
             # Handle HTTP errors before streaming
             _handle_http_error(response, model)
             
-            buffer = ""
-            for chunk in response.iter_content(chunk_size=1024, decode_unicode=True):
-                if chunk:
-                    if not first_chunk_received:
-                        logger.debug("First chunk received from API")
-                        first_chunk_received = True
-                    buffer += chunk
+            # Read in large chunks; chunked responses still yield as soon as
+            # data arrives, so streaming stays live. Deltas that arrive in the
+            # same chunk are printed and reported to on_activity together.
+            for lines in _iter_sse_line_batches(response.iter_content(chunk_size=65536)):
+                if not first_chunk_received:
+                    logger.debug("First chunk received from API")
+                    first_chunk_received = True
+                
+                burst_start = len(content_parts)
+                active = False
+                
+                for line in lines:
+                    line = line.strip()
                     
-                    # Process complete lines in the buffer
-                    while True:
-                        line_end = buffer.find('\n')
-                        if line_end == -1:
-                            break
-                        
-                        line = buffer[:line_end].strip()
-                        buffer = buffer[line_end + 1:]
-                        
-                        # Skip empty lines
-                        if not line:
-                            continue
+                    # Skip empty lines
+                    if not line:
+                        continue
+                    
+                    # Handle SSE comments (like ": OPENROUTER PROCESSING")
+                    # Show user feedback that processing is happening
+                    if line.startswith(b':'):
+                        if not processing_logged:
+                            logger.info("Waiting for model to process...")
+                            processing_logged = True
+                        continue
+                    
+                    # Process data lines
+                    if line.startswith(b'data: '):
+                        data = line[6:]
                         
-                        # Handle SSE comments (like ": OPENROUTER PROCESSING")
-                        # Show user feedback that processing is happening
-                        if line.startswith(':'):
-                            if not processing_logged:
-                                logger.info("Waiting for model to process...")
-                                processing_logged = True
+                        # End of stream. Keep reading rather than breaking out so the
+                        # body is consumed and the connection can go back to the pool.
+                        if data == b'[DONE]':
                             continue
                         
-                        # Process data lines
-                        if line.startswith('data: '):
-                            data = line[6:]
+                        try:
+                            data_obj = _json_loads(data)
                             
-                            # Check for end of stream
-                            if data == '[DONE]':
-                                break
+                            # Capture response metadata
+                            if response_id is None and "id" in data_obj:
+                                response_id = data_obj["id"]
+                            if response_model is None and "model" in data_obj:
+                                response_model = data_obj["model"]
                             
-                            try:
-                                data_obj = json.loads(data)
+                            # Extract content from delta
+                            choices = data_obj.get("choices", [])
+                            if choices:
+                                delta = choices[0].get("delta", {})
+                                content = delta.get("content")
+                                if content:
+                                    content_parts.append(content)
+                                    active = True
                                 
-                                # Capture response metadata
-                                if response_id is None and "id" in data_obj:
-                                    response_id = data_obj["id"]
-                                if response_model is None and "model" in data_obj:
-                                    response_model = data_obj["model"]
+                                # Capture reasoning content (for models like o-series, Claude 3.7+, DeepSeek R1)
+                                reasoning = delta.get("reasoning")
+                                if reasoning:
+                                    reasoning_parts.append(reasoning)
+                                    active = True
                                 
-                                # Extract content from delta
-                                choices = data_obj.get("choices", [])
-                                if choices:
-                                    delta = choices[0].get("delta", {})
-                                    content = delta.get("content")
-                                    if content:
-                                        if not silent:
-                                            print(content, end="", flush=True)
-                                        accumulated_content += content
-                                        if on_activity:
-                                            on_activity()
-                                    
-                                    # Capture reasoning content (for models like o-series, Claude 3.7+, DeepSeek R1)
-                                    reasoning = delta.get("reasoning")
-                                    if reasoning:
-                                        accumulated_reasoning += reasoning
-                                        if on_activity:
-                                            on_activity()
-                                    
-                                    # Capture finish reason
-                                    fr = choices[0].get("finish_reason")
-                                    if fr:
-                                        finish_reason = fr
-                                        
-                            except json.JSONDecodeError:
-                                # Skip malformed JSON chunks
-                                pass
-                    
+                                # Capture finish reason
+                                fr = choices[0].get("finish_reason")
+                                if fr:
+                                    finish_reason = fr
+                        
+                        except ValueError:
+                            # Skip malformed JSON chunks (JSONDecodeError, or
+                            # UnicodeDecodeError for invalid UTF-8)
+                            pass
+                
+                if not silent and len(content_parts) > burst_start:
+                    sys.stdout.write("".join(content_parts[burst_start:]))
+                    sys.stdout.flush()
+                if active and on_activity:
+                    on_activity()
+            
     except requests.Timeout:
         raise OpenRouterError(
             f"Request timed out after {api_config.timeout} seconds",
@@ -329,12 +535,12 @@ def send_prompt_streaming(
     # This ensures extract_code() works with both streaming and non-streaming responses
     message_dict = {
         "role": "assistant",
-        "content": accumulated_content
+        "content": "".join(content_parts)
     }
     
     # Add reasoning fields only if they have content
-    if accumulated_reasoning:
-        message_dict["reasoning"] = accumulated_reasoning
+    if reasoning_parts:
+        message_dict["reasoning"] = "".join(reasoning_parts)
     
     reconstructed_response = {
         "id": response_id or "stream-response",
@@ -347,6 +553,8 @@ def send_prompt_streaming(
         ]
     }
     
+    _store_cached_response(cache_key, reconstructed_response)
+    
     return reconstructed_response
 
 
@@ -359,8 +567,8 @@ def send_prompt(
 ) -> dict:
     """Send a non-streaming chat completion request to OpenRouter.
     
-    Note: For parallel execution, use send_prompt_streaming() directly
-    with silent=True, which is what the parallel runner does.
+    Note: The parallel runner uses this instead of send_prompt_streaming()
+    when api.use_streaming is off. Both use the same response cache.
     
     Args:
         model: The model ID (e.g., 'openai/gpt-4o').
@@ -379,13 +587,18 @@ def send_prompt(
         ContentFilterError: If content is filtered.
         OpenRouterError: For other API errors.
     """
-    url = "https://openrouter.ai/api/v1/chat/completions"
-    headers = _get_headers(api_key)
     payload = _build_payload(model, system_prompt, user_prompt, api_config)
     
+    cache_key = _response_cache_key(model, system_prompt, user_prompt, api_config)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    headers = _get_headers(api_key)
+    
     try:
-        response = requests.post(
-            url,
+        response = _SESSION.post(
+            _API_URL,
             headers=headers,
             json=payload,
             timeout=api_config.timeout,
@@ -416,6 +629,8 @@ def send_prompt(
             if "message" in choice and "reasoning_details" in choice["message"]:
                 del choice["message"]["reasoning_details"]
     
+    _store_cached_response(cache_key, data)
+    
     return data
 
 
@@ -432,7 +647,8 @@ def extract_code(response: dict) -> str:
         The raw OpenSCAD code string.
         
     Raises:
-        ValueError: If no content could be extracted from the response.
+        ValueError: If no content could be extracted from the response, or
+            the extracted code is empty (so no render is attempted for it).
     """
     # Extract content from response
     try:
@@ -448,12 +664,24 @@ def extract_code(response: dict) -> str:
     except (KeyError, IndexError, TypeError) as e:
         raise ValueError(f"Failed to extract content from response: {e}")
     
-    # Strip markdown code fences if present
-    code = _strip_markdown_fences(content)
+    # Strip markdown code fences if present. Raw code without a single
+    # backtick (the usual case) only needs surrounding whitespace trimmed.
+    if '`' not in content:
+        code = content.strip()
+    else:
+        code = _strip_markdown_fences(content)
+    
+    # Fail fast on empty code rather than spawning OpenSCAD just to fail
+    if not code.strip():
+        raise ValueError("Response contains no OpenSCAD code")
     
     return code
 
 
+# Code blocks with an optional language specifier: ```openscad, ```scad, or just ```
+_FENCE_RE = re.compile(r'```(?:openscad|scad)?\s*\n?(.*?)```', re.DOTALL | re.IGNORECASE)
+
+
 def _strip_markdown_fences(content: str) -> str:
     """Strip markdown code fences from content.
     
@@ -471,11 +699,14 @@ def _strip_markdown_fences(content: str) -> str:
     """
     content = content.strip()
     
-    # Pattern to match code blocks with optional language specifier
-    # Matches ```openscad, ```scad, or just ```
-    pattern = r'```(?:openscad|scad)?\s*\n?(.*?)```'
+    # Raw code with no fences is the common case; a substring scan is much
+    # cheaper than running the DOTALL pattern over the whole response
+    if '```' not in content:
+        if content.startswith('`') and content.endswith('`'):
+            return content[1:-1].strip()
+        return content
     
-    matches = re.findall(pattern, content, re.DOTALL | re.IGNORECASE)
+    matches = _FENCE_RE.findall(content)
     
     if matches:
         # If we found code blocks, join them (in case of multiple blocks)
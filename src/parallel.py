@@ -1,6 +1,7 @@
 """Parallel execution module for running multiple models concurrently with live status display."""
 
 import logging
+import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -9,16 +10,26 @@ from typing import Optional, Union
 
 from rich.live import Live
 from rich.table import Table
+from rich.text import Text
 from rich.console import Console
 from rich.logging import RichHandler
 
 from .config import Config
-from .openrouter import send_prompt_streaming, OpenRouterError
+from .openrouter import send_prompt, send_prompt_streaming, reserve_connections, OpenRouterError
 
 
 # Spinner characters for streaming status animation
 SPINNER_CHARS = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+# Longest the live table goes without a redraw while a model is streaming,
+# so the elapsed-time column keeps ticking between chunks
+REFRESH_INTERVAL = 0.1
+
+# Worker threads for model requests, reused by every run_models_parallel call
+# instead of starting and joining a new set of threads for each challenge
+_model_pool: Optional[ThreadPoolExecutor] = None
+_model_pool_size = 0
+
 
 @dataclass
 class ModelStatus:
@@ -33,16 +44,43 @@ class ModelStatus:
     spinner_index: int = field(default=0, repr=False)
 
 
+def _format_status(status: ModelStatus) -> tuple[str, str, str]:
+    """Format the Status and Time cells for one model.
+    
+    Args:
+        status: The model's current status.
+    
+    Returns:
+        Tuple of (status text, status style, elapsed time text).
+    """
+    if status.status == "waiting":
+        status_text, style = "...", "dim"
+    elif status.status == "streaming":
+        status_text, style = SPINNER_CHARS[status.spinner_index % len(SPINNER_CHARS)], "yellow"
+    elif status.status == "done":
+        status_text, style = "✓ Done", "green"
+    elif status.status == "error":
+        status_text, style = "✗ Error", "red"
+    else:
+        status_text, style = status.status, ""
+    
+    return status_text, style, f"{status.elapsed_time:.1f}s"
+
+
 def _build_status_table(
     status_dict: dict[str, ModelStatus],
 ) -> Table:
     """Build a rich Table showing current status of all models.
     
+    A new table is built for every redraw and never modified afterwards, so
+    it can be rendered from other threads (Live prints log records from any
+    thread above the table) while the next frame is being prepared.
+    
     Args:
         status_dict: Dictionary mapping model names to their current status.
     
     Returns:
-        A rich Table with the current status of all models.
+        A rich Table with one row per model, in status_dict order.
     """
     table = Table(
         show_header=True,
@@ -54,33 +92,58 @@ def _build_status_table(
     table.add_column("Time", justify="right", min_width=8)
     
     for model, status in status_dict.items():
-        # Format status display
-        if status.status == "waiting":
-            status_display = "[dim]...[/dim]"
-        elif status.status == "streaming":
-            spinner = SPINNER_CHARS[status.spinner_index % len(SPINNER_CHARS)]
-            status_display = f"[yellow]{spinner}[/yellow]"
-        elif status.status == "done":
-            status_display = "[green]✓ Done[/green]"
-        elif status.status == "error":
-            status_display = "[red]✗ Error[/red]"
-        else:
-            status_display = status.status
-        
-        # Format time display
-        time_display = f"{status.elapsed_time:.1f}s"
-        
-        table.add_row(model, status_display, time_display)
+        status_text, style, time_text = _format_status(status)
+        table.add_row(model, Text(status_text, style=style), time_text)
     
     return table
 
 
+def _get_model_pool(max_workers: int, max_concurrent: Optional[int]) -> ThreadPoolExecutor:
+    """Get the shared model worker pool, replacing it if it's the wrong size.
+    
+    A pool larger than needed is kept (its extra threads simply stay idle)
+    unless that would let more than max_concurrent requests run at once.
+    
+    Args:
+        max_workers: Number of workers this call needs.
+        max_concurrent: Configured cap on simultaneous requests, or None.
+    
+    Returns:
+        A ThreadPoolExecutor with at least max_workers workers.
+    """
+    global _model_pool, _model_pool_size
+    too_small = _model_pool_size < max_workers
+    too_large = max_concurrent is not None and _model_pool_size > max_concurrent
+    if _model_pool is None or too_small or too_large:
+        if _model_pool is not None:
+            _model_pool.shutdown(wait=False)
+        _model_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model")
+        _model_pool_size = max_workers
+        # One keep-alive connection per worker, so none are discarded
+        reserve_connections(max_workers)
+    return _model_pool
+
+
+def shutdown_model_pool() -> None:
+    """Stop the shared model worker threads.
+    
+    Call once after the last run_models_parallel call; a later call starts
+    a new pool.
+    """
+    global _model_pool, _model_pool_size
+    if _model_pool is not None:
+        _model_pool.shutdown(wait=True)
+        _model_pool = None
+        _model_pool_size = 0
+
+
 def _run_single_model(
     model: str,
     challenge_prompt: Union[str, list],
     config: Config,
     status_dict: dict[str, ModelStatus],
     lock: threading.Lock,
+    changed: threading.Event,
 ) -> None:
     """Run a single model API call and update status.
     
@@ -89,54 +152,79 @@ def _run_single_model(
         challenge_prompt: The prompt to send to the model.
         config: Configuration object with API settings.
         status_dict: Shared dictionary to update with status changes.
-        lock: Threading lock for safe status updates.
+        lock: Threading lock held for status transitions (not per-delta updates).
+        changed: Event set after every status update so the display redraws.
     """
     start_time = time.time()
+    status = status_dict[model]
     
     # Update status to streaming
     with lock:
-        status_dict[model].status = "streaming"
-        status_dict[model].start_time = start_time
+        status.status = "streaming"
+        status.start_time = start_time
+    changed.set()
     
     def on_activity() -> None:
-        """Callback invoked when streaming activity is detected."""
-        with lock:
-            status_dict[model].elapsed_time = time.time() - start_time
-            status_dict[model].spinner_index += 1
+        """Callback invoked when streaming activity is detected.
+        
+        Runs for every streamed delta, so it takes no locks: this thread is
+        the only one advancing the spinner, and single attribute writes are
+        atomic. The display thread may read a frame-old value, which is fine.
+        """
+        status.elapsed_time = time.time() - start_time
+        status.spinner_index += 1
+        # Event.set() takes the event's internal lock; skip it when the
+        # display hasn't consumed the previous notification yet
+        if not changed.is_set():
+            changed.set()
     
     try:
-        response = send_prompt_streaming(
-            model=model,
-            system_prompt=config.system_prompt,
-            user_prompt=challenge_prompt,
-            api_config=config.api,
-            api_key=config.api_key,
-            silent=True,
-            on_activity=on_activity,
-        )
+        if config.api.use_streaming:
+            response = send_prompt_streaming(
+                model=model,
+                system_prompt=config.system_prompt,
+                user_prompt=challenge_prompt,
+                api_config=config.api,
+                api_key=config.api_key,
+                silent=True,
+                on_activity=on_activity,
+            )
+        else:
+            # One plain request: no per-delta parsing or callbacks. The
+            # display loop still advances the elapsed time while it runs.
+            response = send_prompt(
+                model=model,
+                system_prompt=config.system_prompt,
+                user_prompt=challenge_prompt,
+                api_config=config.api,
+                api_key=config.api_key,
+            )
         
         elapsed = time.time() - start_time
         
         with lock:
-            status_dict[model].status = "done"
-            status_dict[model].elapsed_time = elapsed
-            status_dict[model].response = response
+            status.status = "done"
+            status.elapsed_time = elapsed
+            status.response = response
+        changed.set()
             
     except OpenRouterError as e:
         elapsed = time.time() - start_time
         
         with lock:
-            status_dict[model].status = "error"
-            status_dict[model].elapsed_time = elapsed
-            status_dict[model].error_message = str(e)
+            status.status = "error"
+            status.elapsed_time = elapsed
+            status.error_message = str(e)
+        changed.set()
             
     except Exception as e:
         elapsed = time.time() - start_time
         
         with lock:
-            status_dict[model].status = "error"
-            status_dict[model].elapsed_time = elapsed
-            status_dict[model].error_message = f"Unexpected error: {e}"
+            status.status = "error"
+            status.elapsed_time = elapsed
+            status.error_message = f"Unexpected error: {e}"
+        changed.set()
 
 
 def run_models_parallel(
@@ -162,79 +250,112 @@ def run_models_parallel(
     }
     
     lock = threading.Lock()
+    changed = threading.Event()
     # Use force_terminal=True to ensure Rich controls the terminal properly
     console = Console(force_terminal=True)
     
-    # Temporarily suppress logging handlers that write to stderr
-    # This prevents logging output from corrupting the Rich Live display
+    # Temporarily detach console logging handlers: they hold the real stderr
+    # and would write over the Rich Live display. File handlers stay attached.
     root_logger = logging.getLogger()
-    original_handlers = root_logger.handlers[:]
+    original_handlers = [
+        handler for handler in root_logger.handlers
+        if isinstance(handler, logging.StreamHandler)
+        and not isinstance(handler, logging.FileHandler)
+    ]
     original_level = root_logger.level
     
-    # Remove all handlers temporarily - we'll restore them after Live display
+    # Remove them temporarily - we'll restore them after Live display
     for handler in original_handlers:
         root_logger.removeHandler(handler)
     
-    # Use ThreadPoolExecutor for parallel execution
-    with ThreadPoolExecutor(max_workers=len(models)) as executor:
-        # Submit all model tasks
-        futures = {
-            executor.submit(
-                _run_single_model,
-                model,
-                challenge_prompt,
-                config,
-                status_dict,
-                lock,
-            ): model
-            for model in models
-        }
-        
-        # Use Rich Live display for real-time updates
-        # transient=True clears the live display when done, preventing stacking
-        # vertical_overflow="visible" ensures the table renders correctly
-        with Live(
-            _build_status_table(status_dict),
-            console=console,
-            refresh_per_second=10,
-            transient=True,
-            vertical_overflow="visible",
-        ) as live:
-            # Poll for updates while tasks are running
-            while not all(
-                status_dict[model].status in ("done", "error")
-                for model in models
-            ):
-                # Update elapsed time for streaming models
-                current_time = time.time()
-                with lock:
-                    for model, status in status_dict.items():
-                        if status.status == "streaming" and status.start_time:
-                            status.elapsed_time = current_time - status.start_time
-                
-                # Refresh the display
-                live.update(
-                    _build_status_table(status_dict)
-                )
-                
-                time.sleep(0.1)
-        
-        # Print final static table after Live display ends
-        # This ensures the final state is visible and won't be overwritten
-        console.print(_build_status_table(status_dict))
-        
-        # Restore logging handlers
+    # Requests are I/O-bound, so one thread per model is the default;
+    # api.max_concurrent caps it for large fan-outs, and queued models simply
+    # show as waiting until a thread is free
+    max_workers = len(models)
+    if config.api.max_concurrent is not None:
+        max_workers = min(max_workers, config.api.max_concurrent)
+    executor = _get_model_pool(max_workers, config.api.max_concurrent)
+    # Submit all model tasks
+    futures = {
+        executor.submit(
+            _run_single_model,
+            model,
+            challenge_prompt,
+            config,
+            status_dict,
+            lock,
+            changed,
+        ): model
+        for model in models
+    }
+    
+    # Use Rich Live display for real-time updates
+    # transient=True clears the live display when done, preventing stacking
+    # vertical_overflow="visible" ensures the table renders correctly
+    # auto_refresh=False: the loop below is the only thing that redraws, so
+    # Rich's refresh thread never renders a table while it's being replaced
+    with Live(
+        _build_status_table(status_dict),
+        console=console,
+        auto_refresh=False,
+        transient=True,
+        vertical_overflow="visible",
+    ) as live:
+        # Live redirects sys.stderr to print above the table, so records from
+        # other stages (e.g. the animation thread) are still shown, formatted
+        # as usual, without corrupting the display
+        live_handlers = []
         for handler in original_handlers:
-            root_logger.addHandler(handler)
-        root_logger.setLevel(original_level)
+            live_handler = logging.StreamHandler(sys.stderr)
+            live_handler.setLevel(handler.level)
+            live_handler.setFormatter(handler.formatter)
+            root_logger.addHandler(live_handler)
+            live_handlers.append(live_handler)
         
-        # Wait for all futures to complete (they should already be done)
-        for future in as_completed(futures):
-            # Just ensure all tasks have completed
-            try:
-                future.result()
-            except Exception:
-                # Errors are already captured in status_dict
-                pass
+        # With auto-refresh off, this loop is the only thing that redraws:
+        # when a worker reports progress, and every REFRESH_INTERVAL while a
+        # model is streaming so its elapsed time keeps ticking between
+        # chunks. A tick with nothing changed or streaming renders nothing.
+        while True:
+            was_changed = changed.wait(REFRESH_INTERVAL)
+            changed.clear()
+            
+            current_time = time.time()
+            with lock:
+                streaming = False
+                finished = True
+                for status in status_dict.values():
+                    if status.status == "streaming":
+                        streaming = True
+                        finished = False
+                        if status.start_time:
+                            status.elapsed_time = current_time - status.start_time
+                    elif status.status == "waiting":
+                        finished = False
+            
+            if finished:
+                break
+            if was_changed or streaming:
+                live.update(_build_status_table(status_dict), refresh=True)
+    
+    # Restore logging handlers as soon as Live stops redirecting stderr
+    for live_handler in live_handlers:
+        root_logger.removeHandler(live_handler)
+    for handler in original_handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(original_level)
+    
+    # Print final static table after Live display ends
+    # This ensures the final state is visible and won't be overwritten
+    console.print(_build_status_table(status_dict))
+    
+    # Wait for all futures to complete (they should already be done)
+    for future in as_completed(futures):
+        # Just ensure all tasks have completed
+        try:
+            future.result()
+        except Exception:
+            # Errors are already captured in status_dict
+            pass
     
     return status_dict
\ No newline at end of file
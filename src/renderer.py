@@ -4,19 +4,39 @@ This module takes generated .scad code and renders it to .stl using the local Op
 It also provides utilities for saving run metadata.
 """
 
+import asyncio
+import hashlib
 import json
+import multiprocessing
+import os
+import queue
+import re
+import shutil
 import subprocess
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Iterator
 
 if TYPE_CHECKING:
     from config import ApiConfig
 
 
+# Environment variable that overrides the number of concurrent renders
+MAX_WORKERS_ENV = "OPENSCAD_BENCH_MAX_WORKERS"
+
+# Only the end of OpenSCAD's stderr is kept for error messages; a model that
+# triggers thousands of warnings shouldn't cost megabytes per render
+_STDERR_TAIL_BYTES = 16384
+
+# Renders a pool worker process handles before it is replaced, so memory or
+# descriptors leaked by long sessions are returned to the OS
+_PROCESS_MAX_TASKS = 64
+
+
 @dataclass
 class RenderResult:
     """Result of an OpenSCAD rendering attempt."""
@@ -28,6 +48,55 @@ class RenderResult:
     render_time: float
 
 
+# orjson serializes several times faster when it's installed. The stdlib
+# fallback is set up to match its layout: 2-space indents, non-ASCII text
+# written as UTF-8, and other mappings (e.g. ApiConfig's read-only parameter
+# views) written as objects. Every JSON artifact goes through dump_json so
+# all files from a run are formatted alike.
+try:
+    import orjson
+    
+    def dump_json(data: dict) -> bytes:
+        """Serialize data as indented JSON, encoded as UTF-8."""
+        return orjson.dumps(data, default=dict, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def dump_json(data: dict) -> bytes:
+        """Serialize data as indented JSON, encoded as UTF-8."""
+        return json.dumps(data, indent=2, ensure_ascii=False, default=dict).encode("utf-8")
+
+# Strings, comments and brackets in OpenSCAD source; strings and comments are
+# matched whole so brackets inside them are skipped
+_SCAD_TOKEN_RE = re.compile(r'"(?:[^"\\\n]|\\.)*"|//[^\n]*|/\*.*?\*/|[(){}\[\]]', re.DOTALL)
+
+# Calls that produce 3D geometry (every user module ends up in one of these)
+# or pull in code from another file that might
+_SCAD_GEOMETRY_RE = re.compile(
+    r"\b(?:cube|sphere|cylinder|polyhedron|linear_extrude|rotate_extrude"
+    r"|import|surface|use|include)\b"
+)
+
+_BRACKET_PAIRS = {")": "(", "]": "[", "}": "{"}
+
+
+# Directories already created by _ensure_dir, so repeat saves into the same
+# attempt directory skip the mkdir syscalls
+_DIRS_EXIST: set[Path] = set()
+_DIRS_LOCK = threading.Lock()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and its parents) unless this process already did.
+
+    Assumes directories aren't deleted during a run. Resets in
+    challenges.prepare_model_output_dir recreate the directory straight away.
+    """
+    if path in _DIRS_EXIST:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    with _DIRS_LOCK:
+        _DIRS_EXIST.add(path)
+
+
 def save_scad(code: str, output_dir: Path, filename: str = "attempt.scad") -> Path:
     """Save OpenSCAD code to the specified directory.
 
@@ -39,9 +108,20 @@ def save_scad(code: str, output_dir: Path, filename: str = "attempt.scad") -> Pa
     Returns:
         Path to the saved file.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
     scad_path = output_dir / filename
-    scad_path.write_text(code, encoding="utf-8")
+    data = code.encode("utf-8")
+    try:
+        # Rewriting identical code would only disturb the file's mtime
+        if scad_path.read_bytes() == data:
+            return scad_path
+    except OSError:
+        pass
+    # Write beside the target and rename it into place, so a concurrent
+    # reader (such as OpenSCAD) never sees a half-written file
+    tmp = output_dir / f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    tmp.write_bytes(data)
+    os.replace(tmp, scad_path)
     return scad_path
 
 
@@ -50,6 +130,10 @@ def render_stl(
 ) -> RenderResult:
     """Render an OpenSCAD file to STL.
 
+    Each call runs a fresh OpenSCAD process. The CLI has no server or batch
+    mode (one input file per invocation), so there is no long-lived process
+    to reuse; concurrency comes from running several renders at once.
+
     Args:
         scad_path: Path to the .scad file to render.
         openscad_path: Path to the OpenSCAD executable.
@@ -58,118 +142,625 @@ def render_stl(
     Returns:
         RenderResult with success/failure information.
     """
-    stl_path = scad_path.with_suffix(".stl")
+    stl_path = _fresh_stl_path(scad_path)
 
     start_time = time.perf_counter()
 
+    # close_fds=False lets CPython launch with posix_spawn instead of
+    # fork+exec, which copies the parent's page tables. That path also needs
+    # an executable path containing a directory (validate_openscad_path
+    # resolves it to an absolute one) and no preexec_fn, cwd or session
+    # options. Python creates its descriptors non-inheritable, so nothing
+    # leaks into the child.
     try:
-        result = subprocess.run(
-            [openscad_path, "-o", str(stl_path), str(scad_path)],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = subprocess.Popen(
+            _openscad_command(openscad_path, scad_path, stl_path),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
         )
-        render_time = time.perf_counter() - start_time
-
-        if result.returncode == 0 and stl_path.exists():
-            return RenderResult(
-                success=True,
-                scad_path=scad_path,
-                stl_path=stl_path,
-                error_message=None,
-                render_time=render_time,
-            )
-        else:
-            # OpenSCAD returned non-zero exit code
-            error_msg = result.stderr.strip() if result.stderr else result.stdout.strip()
-            if not error_msg:
-                error_msg = f"OpenSCAD exited with code {result.returncode}"
-            return RenderResult(
-                success=False,
-                scad_path=scad_path,
-                stl_path=None,
-                error_message=error_msg,
-                render_time=render_time,
-            )
-
     except FileNotFoundError:
-        render_time = time.perf_counter() - start_time
-        return RenderResult(
-            success=False,
-            scad_path=scad_path,
-            stl_path=None,
-            error_message=f"OpenSCAD executable not found: {openscad_path}",
-            render_time=render_time,
+        return _failed_render(
+            scad_path,
+            f"OpenSCAD executable not found: {openscad_path}",
+            time.perf_counter() - start_time,
+        )
+    except OSError as e:
+        return _failed_render(
+            scad_path, f"Failed to run OpenSCAD: {e}", time.perf_counter() - start_time
         )
 
+    # Drain stderr on a helper thread so a chatty render can't fill the pipe
+    # and stall, keeping only the tail
+    stderr_tail = bytearray()
+    reader = threading.Thread(
+        target=_drain_stderr, args=(proc.stderr, stderr_tail), daemon=True
+    )
+    reader.start()
+
+    try:
+        proc.wait(timeout=timeout)
     except subprocess.TimeoutExpired:
-        render_time = time.perf_counter() - start_time
+        proc.kill()
+        proc.wait()
+        return _failed_render(
+            scad_path,
+            f"Rendering timed out after {timeout} seconds",
+            time.perf_counter() - start_time,
+        )
+    reader.join()
+
+    return _finished_render(
+        scad_path,
+        stl_path,
+        proc.returncode,
+        stderr_tail,
+        time.perf_counter() - start_time,
+    )
+
+
+def _fresh_stl_path(scad_path: Path) -> Path:
+    """Get the STL path for a .scad file, removing any STL already there.
+
+    A previous STL may be a hard link into the render cache (see
+    _use_cached_render); OpenSCAD writes its output in place, so rendering
+    over the link would also overwrite the cached copy.
+    """
+    stl_path = scad_path.with_suffix(".stl")
+    try:
+        stl_path.unlink()
+    except FileNotFoundError:
+        pass
+    return stl_path
+
+
+def _openscad_command(openscad_path: str, scad_path: Path, stl_path: Path) -> list[str]:
+    """Build the OpenSCAD command line that renders scad_path to stl_path."""
+    return [openscad_path, "-o", os.fspath(stl_path), os.fspath(scad_path)]
+
+
+def _append_tail(tail: bytearray, chunk: bytes) -> None:
+    """Append output to a buffer, keeping only its last _STDERR_TAIL_BYTES."""
+    tail += chunk
+    if len(tail) > _STDERR_TAIL_BYTES:
+        del tail[:-_STDERR_TAIL_BYTES]
+
+
+def _drain_stderr(stream, tail: bytearray) -> None:
+    """Read a child's stderr until EOF, keeping the tail in ``tail``."""
+    with stream:
+        while chunk := stream.read1(65536):
+            _append_tail(tail, chunk)
+
+
+async def _render_stl_async(
+    scad_path: Path, openscad_path: str, timeout: float
+) -> RenderResult:
+    """Render an OpenSCAD file to STL from an event loop.
+
+    Same behaviour as render_stl, but the child process is awaited rather
+    than blocking a thread while it runs.
+    """
+    stl_path = _fresh_stl_path(scad_path)
+
+    start_time = time.perf_counter()
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_openscad_command(openscad_path, scad_path, stl_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # posix_spawn, as in render_stl
+        )
+    except FileNotFoundError:
+        return _failed_render(
+            scad_path,
+            f"OpenSCAD executable not found: {openscad_path}",
+            time.perf_counter() - start_time,
+        )
+    except OSError as e:
+        return _failed_render(
+            scad_path, f"Failed to run OpenSCAD: {e}", time.perf_counter() - start_time
+        )
+
+    stderr_tail = bytearray()
+
+    async def drain_stderr() -> None:
+        while chunk := await proc.stderr.read(65536):
+            _append_tail(stderr_tail, chunk)
+
+    try:
+        await asyncio.wait_for(asyncio.gather(drain_stderr(), proc.wait()), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return _failed_render(
+            scad_path,
+            f"Rendering timed out after {timeout} seconds",
+            time.perf_counter() - start_time,
+        )
+
+    return _finished_render(
+        scad_path,
+        stl_path,
+        proc.returncode,
+        stderr_tail,
+        time.perf_counter() - start_time,
+    )
+
+
+def _finished_render(
+    scad_path: Path,
+    stl_path: Path,
+    returncode: int,
+    stderr_tail: bytes,
+    render_time: float,
+) -> RenderResult:
+    """Build the RenderResult for an OpenSCAD process that ran to completion.
+
+    The captured stderr is only decoded when the render failed.
+    """
+    if returncode == 0 and stl_path.exists():
         return RenderResult(
-            success=False,
+            success=True,
             scad_path=scad_path,
-            stl_path=None,
-            error_message=f"Rendering timed out after {timeout} seconds",
+            stl_path=stl_path,
+            error_message=None,
             render_time=render_time,
         )
 
+    # OpenSCAD returned non-zero exit code
+    truncated = len(stderr_tail) >= _STDERR_TAIL_BYTES
+    if truncated:
+        # Start at a line boundary rather than mid-line (or mid-character)
+        stderr_tail = stderr_tail[stderr_tail.find(b"\n") + 1:]
+    error_msg = stderr_tail.decode("utf-8", errors="replace").strip()
+    if truncated:
+        error_msg = "...\n" + error_msg
+    if not error_msg:
+        error_msg = f"OpenSCAD exited with code {returncode}"
+    return _failed_render(scad_path, error_msg, render_time)
+
+
+def _quick_validate(code: str) -> str | None:
+    """Catch code that can't render without starting OpenSCAD.
+
+    Only flags code OpenSCAD is certain to reject or render to nothing:
+    empty code, unbalanced brackets, or no 3D geometry at all.
+
+    Returns:
+        An error message, or None if the code should be rendered.
+    """
+    if not code.strip():
+        return "SCAD code is empty"
+    
+    stack: list[tuple[str, int]] = []
+    for match in _SCAD_TOKEN_RE.finditer(code):
+        token = match.group()
+        if len(token) != 1:
+            continue
+        if token in _BRACKET_PAIRS:
+            if not stack or stack[-1][0] != _BRACKET_PAIRS[token]:
+                line = code.count("\n", 0, match.start()) + 1
+                return f"Unmatched '{token}' on line {line}"
+            stack.pop()
+        else:
+            stack.append((token, match.start()))
+    if stack:
+        token, pos = stack[-1]
+        line = code.count("\n", 0, pos) + 1
+        return f"Unclosed '{token}' opened on line {line}"
+    
+    # Search with strings and comments blanked out
+    stripped = _SCAD_TOKEN_RE.sub(lambda m: m.group() if len(m.group()) == 1 else " ", code)
+    if not _SCAD_GEOMETRY_RE.search(stripped):
+        return "SCAD code contains no 3D geometry"
+    return None
+
+
+def _skip_render(scad_path: Path, code: str, cache_file: Path | None) -> RenderResult | None:
+    """Get the result of a render that doesn't need OpenSCAD, if any.
+
+    Code that fails _quick_validate fails straight away, and code with a
+    cached STL reuses it.
+
+    Returns:
+        A RenderResult, or None if OpenSCAD has to run.
+    """
+    error = _quick_validate(code)
+    if error is not None:
+        return _failed_render(scad_path, f"Skipped render: {error}", 0.0)
+    return _use_cached_render(scad_path, cache_file)
+
+
+def _failed_render(scad_path: Path, error_message: str, render_time: float) -> RenderResult:
+    """Build the RenderResult for a render that produced no STL."""
+    return RenderResult(
+        success=False,
+        scad_path=scad_path,
+        stl_path=None,
+        error_message=error_message,
+        render_time=render_time,
+    )
+
 
 def process_attempt(
-    code: str, output_dir: Path, openscad_path: str, timeout: float = 1200.0
+    code: str,
+    output_dir: Path,
+    openscad_path: str,
+    timeout: float = 1200.0,
+    cache_dir: Path | None = None,
 ) -> RenderResult:
     """Save OpenSCAD code and render it to STL.
 
-    Convenience function that combines save_scad and render_stl.
+    Convenience function that combines save_scad and render_stl. Code that
+    is obviously invalid (empty, unbalanced brackets, no 3D geometry) fails
+    without running OpenSCAD.
 
     Args:
         code: The OpenSCAD code to render.
         output_dir: Directory where files will be saved.
         openscad_path: Path to the OpenSCAD executable.
         timeout: Maximum time in seconds to wait for rendering (default: 1200).
+        cache_dir: Optional render cache directory. Code that was rendered
+            before with the same executable reuses the cached STL instead
+            of running OpenSCAD, and new successful renders are added.
 
     Returns:
         RenderResult with success/failure information.
     """
     scad_path = save_scad(code, output_dir)
-    return render_stl(scad_path, openscad_path, timeout=timeout)
+    cache_file = _render_cache_file(cache_dir, code, openscad_path)
+    skipped = _skip_render(scad_path, code, cache_file)
+    if skipped is not None:
+        return skipped
+    return _store_render(render_stl(scad_path, openscad_path, timeout=timeout), cache_file)
+
+
+def _render_cache_file(
+    cache_dir: Path | str | None, code: str, openscad_path: str
+) -> Path | None:
+    """Get the cache location for the STL rendered from some code.
+
+    Entries are keyed on the code and the OpenSCAD executable, since
+    different OpenSCAD versions can produce different meshes.
+    """
+    if cache_dir is None:
+        return None
+    digest = hashlib.blake2b(
+        f"{openscad_path}\0{code}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return Path(cache_dir) / f"{digest}.stl"
+
+
+def _use_cached_render(scad_path: Path, cache_file: Path | None) -> RenderResult | None:
+    """Place a cached STL next to the .scad file, if there is one.
+
+    Returns:
+        A successful RenderResult, or None if the render has to run.
+    """
+    if cache_file is None or not cache_file.is_file():
+        return None
+    stl_path = scad_path.with_suffix(".stl")
+    try:
+        _link_or_copy(cache_file, stl_path)
+    except OSError:
+        return None
+    return RenderResult(
+        success=True,
+        scad_path=scad_path,
+        stl_path=stl_path,
+        error_message=None,
+        render_time=0.0,
+    )
+
+
+def _store_render(result: RenderResult, cache_file: Path | None) -> RenderResult:
+    """Add a successful render's STL to the cache and return the result.
+
+    Failing to write the cache never fails the render.
+    """
+    if cache_file is not None and result.success:
+        try:
+            _ensure_dir(cache_file.parent)
+            # A copy, not a link: the attempt's STL stays writable without
+            # touching the cache
+            _copy_into_place(result.stl_path, cache_file)
+        except OSError:
+            pass
+    return result
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Make dst a hard link to src, copying instead where links aren't possible.
+
+    A copy goes through a temporary file and is renamed into place, so other
+    workers never see a partially written STL.
+    """
+    tmp = _temp_path(dst)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _copy_into_place(src: Path, dst: Path) -> None:
+    """Copy src to dst through a temporary file renamed into place."""
+    tmp = _temp_path(dst)
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _temp_path(dst: Path) -> Path:
+    """Get a temporary path next to dst, unique to this process and thread."""
+    return dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _render_task(
+    key: Hashable,
+    output_dir: str,
+    code: str,
+    openscad_path: str,
+    timeout: float,
+    cache_dir: str | None = None,
+) -> tuple[Hashable, RenderResult]:
+    """Save and render a single task.
+
+    Defined at module scope with plain-string arguments so it can be
+    pickled and shipped to a worker process. An unwritable output directory
+    is reported as a failed render for this task rather than raised, so one
+    bad attempt doesn't take down the whole pool.
+    """
+    try:
+        scad_path = save_scad(code, Path(output_dir))
+    except OSError as e:
+        return key, _failed_render(
+            Path(output_dir) / "attempt.scad", f"Failed to save SCAD file: {e}", 0.0
+        )
+    cache_file = _render_cache_file(cache_dir, code, openscad_path)
+    skipped = _skip_render(scad_path, code, cache_file)
+    if skipped is not None:
+        return key, skipped
+    return key, _store_render(render_stl(scad_path, openscad_path, timeout), cache_file)
+
+
+async def _render_task_async(
+    output_dir: Path,
+    code: str,
+    openscad_path: str,
+    timeout: float,
+    cache_dir: Path | None,
+) -> RenderResult:
+    """Save and render a single task on the event loop.
+
+    The .scad file is small, so it is written inline rather than handed to
+    a thread; only the OpenSCAD run itself is awaited.
+    """
+    try:
+        scad_path = save_scad(code, output_dir)
+    except OSError as e:
+        return _failed_render(
+            output_dir / "attempt.scad", f"Failed to save SCAD file: {e}", 0.0
+        )
+    cache_file = _render_cache_file(cache_dir, code, openscad_path)
+    skipped = _skip_render(scad_path, code, cache_file)
+    if skipped is not None:
+        return skipped
+    return _store_render(
+        await _render_stl_async(scad_path, openscad_path, timeout), cache_file
+    )
+
+
+async def _process_renders_async(
+    render_tasks: Iterable[tuple[Hashable, Path, str]],
+    openscad_path: str,
+    max_workers: int,
+    timeout: float,
+    on_complete: Callable[[Hashable, RenderResult], None] | None,
+    cache_dir: Path | None,
+) -> dict[Hashable, RenderResult]:
+    """Run renders as asyncio subprocesses, at most max_workers at a time."""
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(max_workers)
+    results: dict[Hashable, RenderResult] = {}
+
+    async def run(key: Hashable, output_dir: Path, code: str) -> None:
+        async with slots:
+            result = await _render_task_async(
+                output_dir, code, openscad_path, timeout, cache_dir
+            )
+        results[key] = result
+        if on_complete:
+            on_complete(key, result)
+
+    # The task source may block (e.g. a queue), so it is read from a helper
+    # thread to keep renders already in flight progressing meanwhile
+    tasks = []
+    task_iter = iter(render_tasks)
+    while (task := await loop.run_in_executor(None, next, task_iter, None)) is not None:
+        key, output_dir, code = task
+        tasks.append(asyncio.create_task(run(key, Path(output_dir), code)))
+
+    await asyncio.gather(*tasks)
+    return results
+
+
+def default_render_workers() -> int:
+    """Get the default number of concurrent renders.
+
+    OpenSCAD keeps one core busy per render, so this is one per available
+    core, less one left for the orchestrator. Physical cores are counted
+    when psutil is installed; otherwise the CPUs this process may run on.
+    A positive integer in OPENSCAD_BENCH_MAX_WORKERS takes precedence.
+
+    Returns:
+        The number of renders to run at once (at least 1).
+
+    Raises:
+        ValueError: If OPENSCAD_BENCH_MAX_WORKERS is set but not a positive integer.
+    """
+    override = os.environ.get(MAX_WORKERS_ENV)
+    if override:
+        try:
+            workers = int(override)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise ValueError(f"{MAX_WORKERS_ENV} must be a positive integer, got {override!r}")
+        return workers
+
+    cores = None
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        pass
+    if not cores:
+        if hasattr(os, "sched_getaffinity"):
+            cores = len(os.sched_getaffinity(0))
+        else:
+            cores = os.cpu_count() or 4
+    return max(1, cores - 1)
+
+
+@contextmanager
+def _serial_callbacks(
+    on_complete: Callable[[Hashable, RenderResult], None] | None,
+) -> Iterator[Callable[[Hashable, RenderResult], None] | None]:
+    """Run on_complete calls one at a time on a dedicated thread.
+
+    Yields a function that queues a call and returns at once, so a slow
+    callback never holds up the renders. On exit, waits for the queued calls
+    to finish. The first exception raised by on_complete is re-raised then;
+    calls queued after it are skipped.
+    """
+    if on_complete is None:
+        yield None
+        return
+    
+    calls: queue.SimpleQueue = queue.SimpleQueue()
+    errors: list[BaseException] = []
+    
+    def run_calls() -> None:
+        while (call := calls.get()) is not None:
+            if errors:
+                continue  # keep draining so the queue empties
+            try:
+                on_complete(*call)
+            except BaseException as e:
+                errors.append(e)
+    
+    thread = threading.Thread(target=run_calls, name="render-callbacks")
+    thread.start()
+    try:
+        yield lambda key, result: calls.put((key, result))
+    finally:
+        calls.put(None)
+        thread.join()
+    if errors:
+        raise errors[0]
 
 
 def process_renders_parallel(
-    render_tasks: list[tuple[str, Path, str]],
+    render_tasks: Iterable[tuple[Hashable, Path, str]],
     openscad_path: str,
-    max_workers: int = 5,
+    max_workers: int | None = None,
     timeout: float = 1200.0,
-    on_complete: Callable[[str, RenderResult], None] | None = None,
-) -> dict[str, RenderResult]:
-    """Process multiple renders in parallel with thread pool.
+    on_complete: Callable[[Hashable, RenderResult], None] | None = None,
+    use_processes: bool = False,
+    cache_dir: Path | None = None,
+) -> dict[Hashable, RenderResult]:
+    """Process multiple renders in parallel.
+    
+    Tasks are submitted as soon as they are produced by ``render_tasks``, so a
+    lazily-fed iterable (e.g. ``iter(queue.get, None)``) lets renders start
+    while the producer is still generating work.
+    
+    By default the OpenSCAD processes are supervised by an asyncio event loop
+    on the calling thread, so concurrent renders don't each tie up a thread
+    blocked on its child.
     
     Args:
-        render_tasks: List of tuples (model_name, output_dir, code) to render.
+        render_tasks: Iterable of tuples (key, output_dir, code) to render. The
+            key identifies the task in the results, e.g. a model name.
         openscad_path: Path to the OpenSCAD executable.
-        max_workers: Maximum number of concurrent render threads (default: 5).
+        max_workers: Maximum number of concurrent renders (default: see
+            default_render_workers).
         timeout: Maximum time in seconds per render (default: 1200).
-        on_complete: Optional callback function(model_name, RenderResult) called when each render completes.
+        on_complete: Optional callback function(key, RenderResult) called as soon as
+            each render completes. Calls are made one at a time, in completion
+            order, on a dedicated thread, so a slow callback doesn't delay
+            other renders. An exception from it is re-raised once all renders
+            have finished.
+        use_processes: If True, render in a process pool instead so the
+            Python-side work around each render bypasses the GIL, recycling
+            worker processes periodically to keep memory bounded. Keys must
+            be picklable, and the main script needs an
+            ``if __name__ == "__main__"`` guard since workers are spawned.
+            The event loop is usually enough since OpenSCAD itself runs as
+            a subprocess.
+        cache_dir: Optional render cache directory (see process_attempt).
     
     Returns:
-        Dictionary mapping model names to their RenderResult.
+        Dictionary mapping task keys to their RenderResult.
     """
-    results: dict[str, RenderResult] = {}
+    if max_workers is None:
+        max_workers = default_render_workers()
     
-    def render_task(model: str, output_dir: Path, code: str) -> tuple[str, RenderResult]:
-        scad_path = save_scad(code, output_dir)
-        result = render_stl(scad_path, openscad_path, timeout)
-        return model, result
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(render_task, model, output_dir, code): model
-            for model, output_dir, code in render_tasks
-        }
+    with _serial_callbacks(on_complete) as notify:
+        if not use_processes:
+            return asyncio.run(_process_renders_async(
+                render_tasks, openscad_path, max_workers, timeout, notify, cache_dir
+            ))
+        return _process_renders_pool(
+            render_tasks, openscad_path, max_workers, timeout, notify, cache_dir
+        )
+
+
+def _process_renders_pool(
+    render_tasks: Iterable[tuple[Hashable, Path, str]],
+    openscad_path: str,
+    max_workers: int,
+    timeout: float,
+    on_complete: Callable[[Hashable, RenderResult], None] | None,
+    cache_dir: Path | None,
+) -> dict[Hashable, RenderResult]:
+    """Run renders in a pool of worker processes.
+
+    Each worker is replaced after _PROCESS_MAX_TASKS renders. This uses
+    multiprocessing.Pool rather than ProcessPoolExecutor, whose
+    max_tasks_per_child can deadlock on Python 3.11. Workers are started
+    with "spawn", since forking a parent that runs several threads is unsafe.
+    """
+    results: dict[Hashable, RenderResult] = {}
+    
+    def notify(key_result: tuple[Hashable, RenderResult]) -> None:
+        # Report each render as it finishes rather than after the producer is
+        # exhausted; failures are re-raised below by get()
+        on_complete(*key_result)
+    
+    pool = multiprocessing.get_context("spawn").Pool(
+        max_workers, maxtasksperchild=_PROCESS_MAX_TASKS
+    )
+    try:
+        pending = []
+        for key, output_dir, code in render_tasks:
+            pending.append(pool.apply_async(
+                _render_task,
+                (
+                    key, str(output_dir), code, openscad_path, timeout,
+                    None if cache_dir is None else str(cache_dir),
+                ),
+                callback=notify if on_complete else None,
+            ))
         
-        for future in as_completed(futures):
-            model, result = future.result()
-            results[model] = result
-            if on_complete:
-                on_complete(model, result)
+        for async_result in pending:
+            key, result = async_result.get()
+            results[key] = result
+    finally:
+        pool.close()
+        pool.join()
     
     return results
 
@@ -178,6 +769,7 @@ def save_params_json(
     output_dir: Path,
     model: str,
     api_config: "ApiConfig",
+    cache_key: str | None = None,
 ) -> Path:
     """Save run parameters to a params.json file.
     
@@ -188,11 +780,13 @@ def save_params_json(
         output_dir: Directory where params.json will be saved.
         model: The model ID used for this run.
         api_config: The API configuration with LLM parameters.
+        cache_key: Optional hash identifying the attempt, used by resumed
+            runs to recognise results that are still up to date.
         
     Returns:
         Path to the saved params.json file.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
     
     # Build params dictionary
     params_data = {
@@ -200,8 +794,11 @@ def save_params_json(
         "timestamp": datetime.now().isoformat(),
         "timeout": api_config.timeout,
     }
+    if cache_key is not None:
+        params_data["cache_key"] = cache_key
     
-    # Add all LLM parameters that are set
+    # Add all LLM parameters that are set. Both mappings are built once per
+    # config and serialized as-is, without copying.
     llm_params = api_config.get_all_params()
     if llm_params:
         params_data["llm_parameters"] = llm_params
@@ -211,9 +808,8 @@ def save_params_json(
     if non_default:
         params_data["non_default_parameters"] = non_default
     
-    # Write to file
+    # Write to file in one call
     params_path = output_dir / "params.json"
-    with open(params_path, 'w', encoding='utf-8') as f:
-        json.dump(params_data, f, indent=2)
+    params_path.write_bytes(dump_json(params_data))
     
     return params_path
\ No newline at end of file